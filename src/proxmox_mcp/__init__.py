@@ -2,18 +2,33 @@
 Proxmox MCP Server - A Model Context Protocol server for interacting with Proxmox hypervisors.
 """
 
+import importlib
 from typing import TYPE_CHECKING
 
 __version__ = "0.1.0"
-__all__ = ["ProxmoxMCPServer"]
+__all__ = ["ProxmoxMCPServer", "load_config", "load_template_config", "render_prompt"]
+
+# Provide public entry points lazily to avoid importing `server` (and pydantic/yaml)
+# at package import time, which can also cause a RuntimeWarning when running
+# `python -m proxmox_mcp.server`.
+_LAZY = {
+    "ProxmoxMCPServer": ("proxmox_mcp.server", "ProxmoxMCPServer"),
+    "load_config": ("proxmox_mcp.config.loader", "load_config"),
+    "load_template_config": ("proxmox_mcp.mcp.templates", "load_template_config"),
+    "render_prompt": ("proxmox_mcp.mcp.templates", "render_prompt"),
+}
 
-# Provide ProxmoxMCPServer lazily to avoid importing `server` at package import time,
-# which can cause a RuntimeWarning when running `python -m proxmox_mcp.server`.
 if TYPE_CHECKING:  # for type checkers only
+    from .config.loader import load_config  # pragma: no cover
+    from .mcp.templates import load_template_config, render_prompt  # pragma: no cover
     from .server import ProxmoxMCPServer  # pragma: no cover
 
 def __getattr__(name):
-    if name == "ProxmoxMCPServer":
-        from .server import ProxmoxMCPServer as _ProxmoxMCPServer
-        return _ProxmoxMCPServer
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        module, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module), attr)
+    # Cache on the module so later lookups bypass __getattr__ entirely.
+    globals()[name] = value
+    return value
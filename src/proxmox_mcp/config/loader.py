@@ -10,11 +10,18 @@ This module handles loading and validation of server configuration:
 The module ensures that all required configuration is present
 and valid before the server starts operation.
 """
-import json
 import os
+from pathlib import Path
 from typing import Optional
+
+from pydantic import ValidationError
+
 from .models import Config
 
+# Variables required when no config file is given
+_REQUIRED_ENV = ("PROXMOX_HOST", "PROXMOX_USER", "PROXMOX_TOKEN_NAME", "PROXMOX_TOKEN_VALUE")
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
 def load_config(config_path: Optional[str] = None) -> Config:
     """Load and validate configuration from JSON file.
 
@@ -61,17 +68,19 @@ def load_config(config_path: Optional[str] = None) -> Config:
     """
     if not config_path:
         # Fallback to environment variables for configuration
-        host = os.getenv("PROXMOX_HOST")
-        user = os.getenv("PROXMOX_USER")
-        token_name = os.getenv("PROXMOX_TOKEN_NAME")
-        token_value = os.getenv("PROXMOX_TOKEN_VALUE")
-        port = int(os.getenv("PROXMOX_PORT", "8006"))
-        verify_ssl = os.getenv("PROXMOX_VERIFY_SSL", "true").lower() == "true"
-        service = os.getenv("PROXMOX_SERVICE", "PVE")
-        log_level = os.getenv("LOG_LEVEL", "INFO")
+        env = os.environ
+        missing = [name for name in _REQUIRED_ENV if not env.get(name)]
+        if missing:
+            raise ValueError(
+                "PROXMOX_MCP_CONFIG environment variable must be set "
+                f"(missing: {', '.join(missing)})"
+            )
 
-        if not (host and user and token_name and token_value):
-            raise ValueError("PROXMOX_MCP_CONFIG environment variable must be set")
+        host, user, token_name, token_value = (env[name] for name in _REQUIRED_ENV)
+        port = int(env.get("PROXMOX_PORT", "8006"))
+        verify_ssl = env.get("PROXMOX_VERIFY_SSL", "true").lower() in _TRUTHY
+        service = env.get("PROXMOX_SERVICE", "PVE")
+        log_level = env.get("LOG_LEVEL", "INFO")
 
         env_config = {
             "proxmox": {
@@ -89,15 +98,14 @@ def load_config(config_path: Optional[str] = None) -> Config:
                 "level": log_level,
             },
         }
-        return Config(**env_config)
+        return Config.model_validate(env_config)
 
     try:
-        with open(config_path) as f:
-            config_data = json.load(f)
-            if not config_data.get('proxmox', {}).get('host'):
-                raise ValueError("Proxmox host cannot be empty")
-            return Config(**config_data)
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Invalid JSON in config file: {e}")
+        # Parse and validate in a single pass; the empty-host guard lives on ProxmoxConfig.
+        return Config.model_validate_json(Path(config_path).read_bytes())
+    except ValidationError as e:
+        if any(err["type"] == "json_invalid" for err in e.errors()):
+            raise ValueError(f"Invalid JSON in config file: {e}")
+        raise ValueError(f"Failed to load config: {e}")
     except Exception as e:
         raise ValueError(f"Failed to load config: {e}")
@@ -14,7 +14,7 @@ The models provide:
 - Required vs optional field handling
 """
 from typing import Optional, Annotated
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 class NodeStatus(BaseModel):
     """Model for node status query parameters.
@@ -46,6 +46,13 @@ class ProxmoxConfig(BaseModel):
     verify_ssl: bool = True  # Optional: SSL verification (default: True)
     service: str = "PVE"  # Optional: Service type (default: PVE)
 
+    @field_validator("host")
+    @classmethod
+    def _host_not_empty(cls, value: str) -> str:
+        if not value:
+            raise ValueError("Proxmox host cannot be empty")
+        return value
+
 class AuthConfig(BaseModel):
     """Model for Proxmox authentication configuration.
     
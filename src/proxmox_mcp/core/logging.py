@@ -6,6 +6,8 @@ This module handles logging setup and configuration:
 - Log level management
 - Format customization
 - Handler lifecycle management
+- Buffered file output
+- Background handler thread (QueueHandler/QueueListener)
 
 The logging system supports:
 - Configurable log levels
@@ -14,13 +16,37 @@ The logging system supports:
 - Custom format strings
 - Multiple handler management
 """
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 import tempfile
+import threading
 from typing import Optional
 from ..config.models import LoggingConfig
 
+# Size of the binary write buffer behind the log file
+_BUFFER_SIZE = 64 * 1024
+# Upper bound on how long a buffered INFO/DEBUG record waits before reaching disk
+_FLUSH_INTERVAL = 1.0
+
+# Accepted level names (including the WARN/FATAL aliases logging itself defines)
+_LEVELS = {
+    "CRITICAL": logging.CRITICAL,
+    "FATAL": logging.FATAL,
+    "ERROR": logging.ERROR,
+    "WARNING": logging.WARNING,
+    "WARN": logging.WARN,
+    "INFO": logging.INFO,
+    "DEBUG": logging.DEBUG,
+    "NOTSET": logging.NOTSET,
+}
+
+_flusher: Optional["_PeriodicFlusher"] = None
+_listener: Optional[logging.handlers.QueueListener] = None
+
 def setup_logging(config: LoggingConfig) -> logging.Logger:
     """Configure and initialize logging system.
 
@@ -30,6 +56,10 @@ def setup_logging(config: LoggingConfig) -> logging.Logger:
       * Uses configured log level
       * Applies custom format
     
+      * Written through a 64 KiB buffer, drained every second and
+        flushed (with fsync) on ERROR and at exit
+        (set PROXMOX_MCP_LOG_UNBUFFERED=1 to write each record immediately)
+    
     - Console logging:
       * Always enabled for errors
       * Ensures critical issues are visible
@@ -38,6 +68,8 @@ def setup_logging(config: LoggingConfig) -> logging.Logger:
       * Removes existing handlers
       * Configures new handlers
       * Sets up formatters
+      * Runs the handlers on a QueueListener thread; the root logger only
+        gets a QueueHandler, so logging calls never block on I/O
     
     Args:
         config: Logging configuration containing:
@@ -49,6 +81,9 @@ def setup_logging(config: LoggingConfig) -> logging.Logger:
         Configured logger instance for "proxmox-mcp"
         with appropriate handlers and formatting
 
+    Raises:
+        ValueError: If the configured log level is not a known level name
+
     Example config:
         {
             "level": "INFO",
@@ -56,62 +91,175 @@ def setup_logging(config: LoggingConfig) -> logging.Logger:
             "file": "/path/to/log/file.log"  # Optional
         }
     """
+    env = os.environ
+    try:
+        level = _LEVELS[config.level.upper()]
+    except KeyError:
+        raise ValueError(f"Invalid log level: {config.level}") from None
+
     # Determine log file via env override and make it writable when possible
-    disable_file_log = os.getenv("PROXMOX_MCP_DISABLE_FILE_LOG", "").lower() in {"1", "true", "yes"}
-    log_file = os.getenv("PROXMOX_MCP_LOG_FILE", config.file or "")
-    if log_file:
-        # If relative, resolve against a writable base directory
-        if not os.path.isabs(log_file):
-            base_dir = os.getcwd() or "/"
-            # Avoid root or non-writable directories
-            if base_dir == "/" or not os.access(base_dir, os.W_OK):
-                home_dir = os.path.expanduser("~")
-                if home_dir and os.access(home_dir, os.W_OK):
-                    base_dir = home_dir
-                else:
-                    base_dir = tempfile.gettempdir()
-            log_file = os.path.join(base_dir, log_file)
-        
+    disable_file_log = env.get("PROXMOX_MCP_DISABLE_FILE_LOG", "").lower() in {"1", "true", "yes"}
+    unbuffered = env.get("PROXMOX_MCP_LOG_UNBUFFERED", "").lower() in {"1", "true", "yes"}
+    log_file = env.get("PROXMOX_MCP_LOG_FILE", config.file or "")
+    if log_file and not disable_file_log and not os.path.isabs(log_file):
+        log_file = _resolve_relative_log_file(log_file)
+
     # Create handlers
+    formatter = logging.Formatter(config.format)
     handlers = []
+    _stop_background()
     
     if log_file and not disable_file_log:
+        handler_class = logging.FileHandler if unbuffered else _BufferedFileHandler
         try:
-            file_handler = logging.FileHandler(log_file)
+            file_handler = handler_class(log_file)
         except Exception:
             # Fallback to temp directory
             try:
                 safe_path = os.path.join(tempfile.gettempdir(), os.path.basename(log_file))
-                file_handler = logging.FileHandler(safe_path)
+                file_handler = handler_class(safe_path)
             except Exception as e:
                 print(f"Warning: file logging disabled ({e})", file=sys.stderr)
                 file_handler = None
         if file_handler:
-            file_handler.setLevel(getattr(logging, config.level.upper()))
+            file_handler.setLevel(level)
+            file_handler.setFormatter(formatter)
+            if isinstance(file_handler, _BufferedFileHandler):
+                _start_flusher(file_handler)
             handlers.append(file_handler)
     
     # Console handler for errors only to stderr (to not corrupt MCP stdout)
     console_handler = logging.StreamHandler(stream=os.sys.stderr)
     console_handler.setLevel(logging.ERROR)
+    console_handler.setFormatter(formatter)
     handlers.append(console_handler)
     
-    # Configure formatters
-    formatter = logging.Formatter(config.format)
-    for handler in handlers:
-        handler.setFormatter(formatter)
-    
     # Configure root logger
     root_logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, config.level.upper()))
+    root_logger.setLevel(level)
     
-    # Remove any existing handlers
-    for handler in root_logger.handlers[:]:
-        root_logger.removeHandler(handler)
+    # Remove and release any existing handlers under a single lock acquisition
+    with logging._lock:  # type: ignore[attr-defined]
+        for handler in root_logger.handlers:
+            handler.close()
+        root_logger.handlers.clear()
     
-    # Add new handlers
-    for handler in handlers:
-        root_logger.addHandler(handler)
+    # Hand records to the real handlers on a background thread
+    global _listener
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
     
     # Create and return server logger
     logger = logging.getLogger("proxmox-mcp")
+    logger._queue_listener = _listener  # type: ignore[attr-defined]
     return logger
+
+
+class _BufferedFileHandler(logging.StreamHandler):
+    """File handler that writes encoded records through a large binary buffer.
+
+    Records reach the OS when the buffer fills, on ERROR and above, or when
+    :meth:`drain` is called by the periodic flusher. Explicit :meth:`flush`
+    calls (ERROR records, shutdown) also fsync the file.
+    """
+
+    def __init__(self, filename: str, buffer_size: int = _BUFFER_SIZE):
+        self.baseFilename = os.path.abspath(filename)
+        super().__init__(open(self.baseFilename, "ab", buffering=buffer_size))
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write((self.format(record) + "\n").encode("utf-8", "backslashreplace"))
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def drain(self) -> None:
+        """Hand buffered bytes to the OS without forcing them to disk."""
+        with self.lock:
+            if self.stream and not self.stream.closed:
+                self.stream.flush()
+
+    def flush(self) -> None:
+        with self.lock:
+            if self.stream and not self.stream.closed:
+                self.stream.flush()
+                os.fsync(self.stream.fileno())
+
+    def close(self) -> None:
+        with self.lock:
+            try:
+                if self.stream and not self.stream.closed:
+                    try:
+                        self.flush()
+                    finally:
+                        self.stream.close()
+            finally:
+                logging.Handler.close(self)
+
+
+def _start_flusher(handler: _BufferedFileHandler) -> None:
+    global _flusher
+    _flusher = _PeriodicFlusher(handler, _FLUSH_INTERVAL)
+    _flusher.start()
+
+
+def _stop_background() -> None:
+    """Drain and stop the listener and flusher started by a previous setup."""
+    global _flusher, _listener
+    listener, _listener = _listener, None
+    if listener is not None:
+        listener.stop()
+    if _flusher is not None:
+        _flusher.stop()
+        _flusher = None
+    if listener is not None:
+        for handler in listener.handlers:
+            handler.close()
+
+
+class _PeriodicFlusher(threading.Thread):
+    """Daemon thread that drains a buffered file handler at a fixed interval."""
+
+    def __init__(self, handler: _BufferedFileHandler, interval: float):
+        super().__init__(name="proxmox-mcp-log-flusher", daemon=True)
+        self._handler = handler
+        self._interval = interval
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self._stopped.wait(self._interval):
+            self._handler.drain()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._handler.flush()
+
+
+atexit.register(_stop_background)
+
+
+def _resolve_relative_log_file(log_file: str) -> str:
+    """Resolve a relative log path against the first writable base directory.
+
+    Tries the working directory (unless it is the filesystem root), then the
+    home directory, then the system temp directory. Writability is probed by
+    opening the target in append mode, which costs one syscall per candidate
+    instead of a separate access check.
+    """
+    cwd = os.getcwd() or "/"
+    candidates = [cwd] if cwd != "/" else []
+    home_dir = os.path.expanduser("~")
+    if home_dir and home_dir != cwd:
+        candidates.append(home_dir)
+    for base_dir in candidates:
+        path = os.path.join(base_dir, log_file)
+        try:
+            with open(path, "a"):
+                return path
+        except OSError:
+            continue
+    return os.path.join(tempfile.gettempdir(), log_file)
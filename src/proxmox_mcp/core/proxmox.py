@@ -6,6 +6,7 @@ This module handles the core Proxmox API integration, providing:
 - Token-based authentication
 - Connection testing and validation
 - Error handling for API operations
+- Pooled keep-alive HTTP connections with retries
 
 The ProxmoxManager class serves as the central point for all Proxmox API
 interactions, ensuring consistent connection handling and authentication
@@ -13,10 +14,17 @@ across the MCP server.
 """
 import logging
 import os
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+import requests
 from proxmoxer import ProxmoxAPI
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from ..config.models import ProxmoxConfig, AuthConfig
 
+# Connection pool sizing for the shared proxmoxer session
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 64
+
 class ProxmoxManager:
     """Manager class for Proxmox API operations.
     
@@ -105,6 +113,7 @@ class ProxmoxManager:
         try:
             self.logger.info(f"Connecting to Proxmox host: {self.config['host']}")
             api = ProxmoxAPI(**self.config)
+            self._configure_session(api)
 
             # Optionally skip initial connectivity test for IDE/desktop MCP integrations
             skip_test = os.getenv("PROXMOX_MCP_SKIP_CONNECT_TEST", "").lower() in {"1", "true", "yes"}
@@ -121,6 +130,43 @@ class ProxmoxManager:
             self.logger.error(f"Failed to connect to Proxmox: {e}")
             raise RuntimeError(f"Failed to connect to Proxmox: {e}")
 
+    def _configure_session(self, api: ProxmoxAPI) -> None:
+        """Mount a pooled, retrying HTTP adapter on proxmoxer's session.
+
+        proxmoxer keeps one ``requests.Session`` per API object and shares it
+        with every resource derived from it, so a larger pool here lets all
+        tools reuse keep-alive connections instead of reopening TCP/TLS under
+        concurrent use. Retries only cover connection errors and 502/503/504
+        on idempotent methods; POSTs are never replayed.
+        """
+        session = self._get_session(api)
+        if session is None:
+            return
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=(502, 503, 504),
+                raise_on_status=False,
+            ),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+    @staticmethod
+    def _get_session(api: Any) -> Optional[requests.Session]:
+        store = getattr(api, "_store", None)
+        session = store.get("session") if isinstance(store, dict) else None
+        return session if isinstance(session, requests.Session) else None
+
+    def close(self) -> None:
+        """Close pooled connections held by the API session."""
+        session = self._get_session(self.api)
+        if session is not None:
+            session.close()
+
     def get_api(self) -> ProxmoxAPI:
         """Get the initialized Proxmox API instance.
         
@@ -4,8 +4,6 @@ Output templates for Proxmox MCP resource types.
 from typing import Dict, List, Any
 from .formatters import ProxmoxFormatters
 from .theme import ProxmoxTheme
-from .colors import ProxmoxColors
-from .components import ProxmoxComponents
 
 class ProxmoxTemplates:
     """Output templates for different Proxmox resource types."""
@@ -1,27 +1,90 @@
 from __future__ import annotations
 
+import functools
+import os
+import string
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
-import yaml
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Mapping, NamedTuple, Optional
 
+_FORMATTER = string.Formatter()
 
-@dataclass
+# What str.format_map can raise for a bad template or params: bad format specs,
+# failed attribute/index lookups (KeyError from e.g. {vm[id]}) and positional fields.
+_FORMAT_ERRORS = (AttributeError, IndexError, KeyError, TypeError, ValueError)
+
+
+class _SafeDict(dict):
+    """Mapping for str.format_map that leaves unknown placeholders in place."""
+
+    def __missing__(self, key: str) -> str:
+        return "{" + key + "}"
+
+
+class _TemplateMeta(NamedTuple):
+    """Per-string data derived once at load time."""
+
+    template: str
+    placeholders: FrozenSet[str]
+    # Fragment names referenced by a command template (empty for fragments)
+    fragments: FrozenSet[str] = frozenset()
+    # Rendered text of a template without fields ({{ and }} unescaped), else None
+    static: Optional[str] = None
+
+
+@dataclass(frozen=True)
 class TemplateConfig:
+    # Instances are shared through the load cache, so they are frozen and slotted.
+    # __slots__ is declared by hand because dataclass(slots=True) needs Python 3.10.
+    __slots__ = (
+        "base_url",
+        "mode",
+        "auth_type",
+        "api_key",
+        "templates",
+        "fragments",
+        "_template_meta",
+        "_fragment_meta",
+    )
+
     base_url: str
     mode: str
     auth_type: str
     api_key: Optional[str]
-    templates: Dict[str, str]
-    fragments: Dict[str, str]
+    templates: Mapping[str, str]
+    fragments: Mapping[str, str]
+
+    def __post_init__(self) -> None:
+        # Keep read-only copies so the metadata below can't go out of sync with
+        # them, and edits can't leak into other users of the cached config.
+        object.__setattr__(self, "templates", MappingProxyType(dict(self.templates)))
+        object.__setattr__(self, "fragments", MappingProxyType(dict(self.fragments)))
+        # Placeholder sets never change for a loaded config, so parse them once here
+        # instead of on every render_prompt call.
+        fragment_names = frozenset(self.fragments)
+        object.__setattr__(self, "_template_meta", _build_meta(self.templates, fragment_names))
+        object.__setattr__(self, "_fragment_meta", _build_meta(self.fragments))
 
 
 def load_template_config(path: str = "config/mcp_integration.yaml") -> TemplateConfig:
-    data = yaml.safe_load(Path(path).read_text())
-    server = data.get("mcp_server", {})
-    templates = data.get("command_templates", {})
-    fragments = data.get("fragments", {})
-    auth = server.get("authentication", {})
+    st = os.stat(path)
+    return _load_template_config(os.fspath(path), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_template_config(path: str, mtime_ns: int, size: int) -> TemplateConfig:
+    # mtime_ns/size only take part in the cache key so edits to the file are picked up.
+    # PyYAML is imported here so render_prompt with a preloaded config never pays for it.
+    import yaml
+
+    # libyaml's C loader reads the raw bytes (and detects their encoding) itself.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    data = yaml.load(Path(path).read_bytes(), Loader=loader) or {}
+    server = data.get("mcp_server") or {}
+    templates = data.get("command_templates") or {}
+    fragments = data.get("fragments") or {}
+    auth = server.get("authentication") or {}
     return TemplateConfig(
         base_url=server.get("base_url", "http://localhost:8811"),
         mode=server.get("mode", "openapi"),
@@ -40,34 +103,71 @@ def render_prompt(template_key: str, params: Dict[str, Any], cfg: Optional[Templ
         # Fallback: generic description
         return f"Execute {template_key} with parameters: {params}"
 
-    # Build optional fragments
-    fragments: Dict[str, str] = {}
-    for name, frag_tpl in cfg.fragments.items():
+    # Fast paths: static templates, and templates fully covered by params without fragments
+    meta = cfg._template_meta[template_key]
+    if meta.static is not None:
+        return meta.static
+    if not meta.fragments and meta.placeholders <= params.keys():
         try:
-            filled = frag_tpl.format(**params)
-        except Exception:
-            filled = frag_tpl
-        # include only if all referenced keys exist and are truthy
-        keys_present = all(k in params and params[k] not in (None, "") for k in _extract_placeholders(frag_tpl))
-        fragments[name] = (filled if keys_present else "")
-
-    # Merge params and fragments for final formatting
-    merged = {**params, **fragments}
+            return tpl.format_map(params)
+        except _FORMAT_ERRORS:
+            pass  # fall through to the general path and its fallback
+
+    # Build optional fragments; include one only if all referenced keys exist and are truthy
+    present_keys = {k for k, v in params.items() if v not in (None, "")}
+    fragments = {
+        name: (_fill_fragment(frag.template, params) if frag.placeholders <= present_keys else "")
+        for name, frag in cfg._fragment_meta.items()
+    }
+
+    # Merge params and fragments for final formatting; missing keys stay as literal placeholders
+    merged = _SafeDict(params)
+    merged.update(fragments)
     try:
-        return tpl.format(**merged)
-    except Exception:
+        return tpl.format_map(merged)
+    except _FORMAT_ERRORS:
         # Best-effort fallback
-        return f"{tpl} | Params: {merged}"
+        return f"{tpl} | Params: {dict(merged)}"
+
+
+def _fill_fragment(frag_tpl: str, params: Dict[str, Any]) -> str:
+    try:
+        return frag_tpl.format_map(params)
+    except _FORMAT_ERRORS:
+        return frag_tpl
+
+
+def _build_meta(
+    templates: Mapping[str, str], fragment_names: FrozenSet[str] = frozenset()
+) -> Dict[str, _TemplateMeta]:
+    meta = {}
+    for name, tpl in templates.items():
+        placeholders = _extract_placeholders(tpl)
+        meta[name] = _TemplateMeta(tpl, placeholders, placeholders & fragment_names, _static_text(tpl))
+    return meta
 
 
-def _extract_placeholders(s: str) -> set[str]:
-    import string
+def _static_text(tpl: str) -> Optional[str]:
+    try:
+        return tpl.format()
+    except (IndexError, KeyError, ValueError):
+        return None  # has fields (or is malformed); rendered per call
+
 
-    formatter = string.Formatter()
+def _extract_placeholders(s: str) -> FrozenSet[str]:
+    """Top-level params a format string looks up (``vm`` for ``{vm.id}`` or ``{vm[0]}``)."""
     names = set()
-    for literal_text, field_name, format_spec, conversion in formatter.parse(s):
-        if field_name:
-            names.add(field_name)
-    return names
+    try:
+        for _, field_name, _, _ in _FORMATTER.parse(s):
+            if field_name:
+                names.add(_root_name(field_name))
+    except ValueError:
+        pass  # malformed template; rendering falls back on its own
+    return frozenset(names)
 
 
+def _root_name(field_name: str) -> str:
+    for i, ch in enumerate(field_name):
+        if ch in ".[":
+            return field_name[:i]
+    return field_name
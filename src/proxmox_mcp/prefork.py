@@ -0,0 +1,166 @@
+"""
+Pre-forked worker pool for the Proxmox MCP server.
+
+Launching ``proxmox-mcp`` once per MCP session pays for interpreter startup,
+importing FastMCP/pydantic and building the tool schemas every time. This
+entry point does that work once in a parent process, then forks ``--workers``
+children that wait on a shared listening socket. Each child serves a single
+client over the accepted connection (as if it were stdio) and exits; the
+parent immediately forks a replacement.
+
+Clients that expect a stdio server can be pointed at the pool with a
+lightweight bridge, e.g.::
+
+    socat STDIO UNIX-CONNECT:/run/proxmox-mcp.sock
+
+There is no client authentication: anyone who can connect gets a full
+session with the configured Proxmox credentials. The Unix socket is created
+owner-only; a TCP listener should stay on a loopback address (the default),
+and a warning is logged when it is not.
+
+Every idle worker holds the listening socket and every active one a client
+connection plus its Proxmox HTTPS pool, so raise ``ulimit -n`` accordingly
+for large pools. POSIX only (requires ``os.fork``).
+"""
+import argparse
+import ipaddress
+import logging
+import os
+import signal
+import socket
+import sys
+from typing import Optional, Set
+
+logger = logging.getLogger("proxmox-mcp.prefork")
+
+
+def _warm_imports() -> None:
+    """Import and prebuild everything a worker needs, so children inherit it."""
+    from mcp.server.fastmcp import FastMCP  # noqa: F401
+
+    from . import server
+    from .tools import definitions
+    from .tools.registry import TOOLS
+    from .tools.schemas import json_schema
+
+    for module, _ in server._TOOL_MODULES.values():
+        __import__(module)
+    for spec in TOOLS:
+        json_schema(spec.params)
+        getattr(definitions, spec.description)
+
+
+def _listen(args: argparse.Namespace) -> socket.socket:
+    if args.socket:
+        if os.path.exists(args.socket):
+            os.unlink(args.socket)
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # Owner-only: any client that connects acts with the Proxmox credentials
+        old_umask = os.umask(0o077)
+        try:
+            listener.bind(args.socket)
+        finally:
+            os.umask(old_umask)
+    else:
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        listener.bind((args.host, args.port))
+    listener.listen(args.workers)
+    return listener
+
+
+def _is_loopback(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def _serve_one(listener: socket.socket, config_path: Optional[str]) -> None:
+    """Worker body: accept one client and run a server on it as stdin/stdout."""
+    from .server import ProxmoxMCPServer
+
+    conn, _ = listener.accept()
+    listener.close()
+    os.dup2(conn.fileno(), 0)
+    os.dup2(conn.fileno(), 1)
+    conn.close()
+    ProxmoxMCPServer(config_path).start()
+
+
+def _spawn(listener: socket.socket, config_path: Optional[str]) -> int:
+    pid = os.fork()
+    if pid:
+        return pid
+    # Child: restore default signal handling; the server installs its own.
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    code = 0
+    try:
+        _serve_one(listener, config_path)
+    except BaseException as e:  # never fall back into the parent's loop
+        if not isinstance(e, (SystemExit, KeyboardInterrupt)):
+            # Server logging may be file-only by now; stdout is the client socket
+            print(f"Error: worker failed: {e}", file=sys.stderr, flush=True)
+            code = 1
+    finally:
+        os._exit(code)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Serve Proxmox MCP from a pool of pre-forked workers"
+    )
+    where = parser.add_mutually_exclusive_group(required=True)
+    where.add_argument("--socket", help="Unix socket path to listen on")
+    where.add_argument("--port", type=int, help="TCP port to listen on")
+    parser.add_argument("--host", default="127.0.0.1", help="TCP bind address (with --port)")
+    parser.add_argument(
+        "--workers", type=int, default=4, help="Number of warm workers (concurrent sessions)"
+    )
+    args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    logging.basicConfig(level=logging.INFO, stream=sys.stderr)
+    if not hasattr(os, "fork"):
+        print("Error: proxmox-mcp-prefork requires os.fork (POSIX)", file=sys.stderr, flush=True)
+        sys.exit(1)
+
+    config_path = os.getenv("PROXMOX_MCP_CONFIG")
+    _warm_imports()
+    listener = _listen(args)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    address = args.socket or "%s:%d" % (args.host, args.port)
+    logger.info("Listening on %s with %d workers", address, args.workers)
+    if args.port is not None and not _is_loopback(args.host):
+        logger.warning(
+            "%s is not a loopback address: any client that can reach it gets an "
+            "unauthenticated session with the configured Proxmox credentials",
+            args.host,
+        )
+
+    children: Set[int] = set()
+    try:
+        while True:
+            while len(children) < args.workers:
+                children.add(_spawn(listener, config_path))
+            pid, _ = os.wait()
+            children.discard(pid)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        listener.close()
+        if args.socket and os.path.exists(args.socket):
+            os.unlink(args.socket)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Small time-bounded cache for read-only tool results.
+
+Agents tend to re-query the same cluster state (nodes, resources, storage)
+several times within one reasoning loop. Holding results for a couple of
+seconds collapses those bursts into a single Proxmox API call while keeping
+the data fresh enough for interactive use.
+"""
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Mapping-like cache whose entries expire ``ttl`` seconds after being stored.
+
+    When ``maxsize`` is reached the oldest entry is evicted. Expired entries
+    stay in place (until evicted, overwritten or cleared) so they can still be
+    served by :meth:`get_stale`. Not thread-safe; the server only touches it
+    from the event loop.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 2.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        entry = self._data.get(key, _MISSING)
+        if entry is _MISSING:
+            return default
+        expires, value = entry
+        if expires <= time.monotonic():
+            return default
+        return value
+
+    def get_stale(self, key: Hashable, default: Optional[Any] = None, max_age: Optional[float] = None) -> Any:
+        """Return the last value stored under ``key``, even if it has expired.
+
+        With ``max_age`` set, values expired for longer than that many seconds
+        are not returned.
+        """
+        entry = self._data.get(key, _MISSING)
+        if entry is _MISSING:
+            return default
+        expires, value = entry
+        if max_age is not None and time.monotonic() - expires > max_age:
+            return default
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store ``value``, expiring after ``ttl`` seconds (default: the cache's ttl)."""
+        self._data.pop(key, None)
+        while len(self._data) >= self.maxsize:
+            self._data.popitem(last=False)
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+
+    def pop(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Remove ``key`` and return its (possibly expired) value."""
+        entry = self._data.pop(key, _MISSING)
+        return default if entry is _MISSING else entry[1]
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self.set(key, value)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def clear(self) -> None:
+        self._data.clear()
@@ -1,16 +1,20 @@
-from typing import List, Optional
-import json
+from typing import Any, List, Optional, Union
 from mcp.types import TextContent as Content
 from .base import ProxmoxTool
 
 
+def _payload(**fields: Any) -> dict:
+    """Build API parameters, dropping unset (None) values and sending booleans as 0/1."""
+    return {k: int(v) if isinstance(v, bool) else v for k, v in fields.items() if v is not None}
+
+
 class AccessTools(ProxmoxTool):
     """Wrappers for /access API (users, groups, roles, ACL)."""
 
     # Users
-    def list_users(self) -> List[Content]:
-        result = self.proxmox.access.users.get()
-        return [Content(type="text", text=json.dumps(result))]
+    def list_users(self, raw: bool = False) -> Union[List[Content], Any]:
+        result = self._root("access").users.get()
+        return self._ok(result, raw)
 
     def create_user(
         self,
@@ -20,59 +24,51 @@ class AccessTools(ProxmoxTool):
         expire: Optional[int] = None,
         enable: Optional[bool] = True,
     ) -> List[Content]:
-        payload = {"userid": user}
-        if password is not None:
-            payload["password"] = password
-        if comment is not None:
-            payload["comment"] = comment
-        if expire is not None:
-            payload["expire"] = expire
-        if enable is not None:
-            payload["enable"] = int(bool(enable))
-        result = self.proxmox.access.users.post(**payload)
-        return [Content(type="text", text=json.dumps(result))]
+        payload = _payload(
+            userid=user, password=password, comment=comment, expire=expire, enable=enable
+        )
+        result = self._root("access").users.post(**payload)
+        return self._pack(result)
 
     def update_user(self, user: str, changes: dict) -> List[Content]:
-        result = self.proxmox.access.users(user).put(**(changes or {}))
-        return [Content(type="text", text=json.dumps(result))]
+        result = self._root("access").users(user).put(**(changes or {}))
+        return self._pack(result)
 
     def delete_user(self, user: str) -> List[Content]:
-        result = self.proxmox.access.users(user).delete()
-        return [Content(type="text", text=json.dumps(result))]
+        result = self._root("access").users(user).delete()
+        return self._pack(result)
 
     # Groups
-    def list_groups(self) -> List[Content]:
-        result = self.proxmox.access.groups.get()
-        return [Content(type="text", text=json.dumps(result))]
+    def list_groups(self, raw: bool = False) -> Union[List[Content], Any]:
+        result = self._root("access").groups.get()
+        return self._ok(result, raw)
 
     def create_group(self, groupid: str, comment: Optional[str] = None) -> List[Content]:
-        payload = {"groupid": groupid}
-        if comment is not None:
-            payload["comment"] = comment
-        result = self.proxmox.access.groups.post(**payload)
-        return [Content(type="text", text=json.dumps(result))]
+        payload = _payload(groupid=groupid, comment=comment)
+        result = self._root("access").groups.post(**payload)
+        return self._pack(result)
 
     def delete_group(self, groupid: str) -> List[Content]:
-        result = self.proxmox.access.groups(groupid).delete()
-        return [Content(type="text", text=json.dumps(result))]
+        result = self._root("access").groups(groupid).delete()
+        return self._pack(result)
 
     # Roles
-    def list_roles(self) -> List[Content]:
-        result = self.proxmox.access.roles.get()
-        return [Content(type="text", text=json.dumps(result))]
+    def list_roles(self, raw: bool = False) -> Union[List[Content], Any]:
+        result = self._root("access").roles.get()
+        return self._ok(result, raw)
 
     def create_role(self, roleid: str, privs: str) -> List[Content]:
-        result = self.proxmox.access.roles.post(roleid=roleid, privs=privs)
-        return [Content(type="text", text=json.dumps(result))]
+        result = self._root("access").roles.post(roleid=roleid, privs=privs)
+        return self._pack(result)
 
     def delete_role(self, roleid: str) -> List[Content]:
-        result = self.proxmox.access.roles(roleid).delete()
-        return [Content(type="text", text=json.dumps(result))]
+        result = self._root("access").roles(roleid).delete()
+        return self._pack(result)
 
     # ACL
-    def get_acl(self) -> List[Content]:
-        result = self.proxmox.access.acl.get()
-        return [Content(type="text", text=json.dumps(result))]
+    def get_acl(self, raw: bool = False) -> Union[List[Content], Any]:
+        result = self._root("access").acl.get()
+        return self._ok(result, raw)
 
     def set_acl(
         self,
@@ -83,18 +79,10 @@ class AccessTools(ProxmoxTool):
         propagate: Optional[bool] = True,
         delete: Optional[bool] = None,
     ) -> List[Content]:
-        payload = {"path": path}
-        if roles is not None:
-            payload["roles"] = roles
-        if users is not None:
-            payload["users"] = users
-        if groups is not None:
-            payload["groups"] = groups
-        if propagate is not None:
-            payload["propagate"] = int(bool(propagate))
-        if delete is not None:
-            payload["delete"] = int(bool(delete))
-        result = self.proxmox.access.acl.put(**payload)
-        return [Content(type="text", text=json.dumps(result))]
+        payload = _payload(
+            path=path, roles=roles, users=users, groups=groups, propagate=propagate, delete=delete,
+        )
+        result = self._root("access").acl.put(**payload)
+        return self._pack(result)
 
 
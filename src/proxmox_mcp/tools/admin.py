@@ -1,48 +1,71 @@
-from typing import List, Optional
-import json
+from typing import Any, Callable, List, Union
 from mcp.types import TextContent as Content
-from .base import ProxmoxTool
+from .base import NODE_FANOUT, ProxmoxTool
+
+SERVICE_ACTIONS = frozenset({"start", "stop", "restart", "reload"})
 
 
 class AdminTools(ProxmoxTool):
     """Node administrative wrappers: services, network, apt, certificates, disks."""
 
     # Services
-    def list_services(self, node: str) -> List[Content]:
-        result = self.proxmox.nodes(node).services.get()
-        return [Content(type="text", text=json.dumps(result))]
+    def list_services(self, node: str, raw: bool = False) -> Union[List[Content], Any]:
+        result = self._node(node).services.get()
+        return self._ok(result, raw)
 
     def service_action(self, node: str, service: str, action: str) -> List[Content]:
-        endpoint = getattr(self.proxmox.nodes(node).services(service), action)
-        result = endpoint.post()
-        return [Content(type="text", text=json.dumps({"task": result}))]
+        if action not in SERVICE_ACTIONS:
+            raise ValueError(f"Invalid input: action must be one of {', '.join(sorted(SERVICE_ACTIONS))}")
+        # Append the action as a path segment; no attribute lookup on user input
+        result = self._node(node).services(service)(action).post()
+        return self._pack({"task": result})
 
     # Network
-    def network_get(self, node: str) -> List[Content]:
-        result = self.proxmox.nodes(node).network.get()
-        return [Content(type="text", text=json.dumps(result))]
+    def network_get(self, node: str, raw: bool = False) -> Union[List[Content], Any]:
+        result = self._node(node).network.get()
+        return self._ok(result, raw)
 
     def network_apply(self, node: str) -> List[Content]:
-        result = self.proxmox.nodes(node).network.apply.post()
-        return [Content(type="text", text=json.dumps(result))]
+        result = self._node(node).network.apply.post()
+        return self._pack(result)
 
     # APT
-    def list_updates(self, node: str) -> List[Content]:
-        result = self.proxmox.nodes(node).apt.update.get()
-        return [Content(type="text", text=json.dumps(result))]
+    def list_updates(self, node: str, raw: bool = False) -> Union[List[Content], Any]:
+        result = self._node(node).apt.update.get()
+        return self._ok(result, raw)
 
-    def list_repositories(self, node: str) -> List[Content]:
-        result = self.proxmox.nodes(node).apt.repositories.get()
-        return [Content(type="text", text=json.dumps(result))]
+    def list_repositories(self, node: str, raw: bool = False) -> Union[List[Content], Any]:
+        result = self._node(node).apt.repositories.get()
+        return self._ok(result, raw)
 
     # Certificates
-    def get_certificates(self, node: str) -> List[Content]:
-        result = self.proxmox.nodes(node).certificates.info.get()
-        return [Content(type="text", text=json.dumps(result))]
+    def get_certificates(self, node: str, raw: bool = False) -> Union[List[Content], Any]:
+        result = self._node(node).certificates.info.get()
+        return self._ok(result, raw)
 
     # Disks
-    def list_disks(self, node: str) -> List[Content]:
-        result = self.proxmox.nodes(node).disks.list.get()
-        return [Content(type="text", text=json.dumps(result))]
+    def list_disks(self, node: str, raw: bool = False) -> Union[List[Content], Any]:
+        result = self._node(node).disks.list.get()
+        return self._ok(result, raw)
+
+    # Multi-node variants: one tool call instead of one per node
+    async def list_services_batch(self, nodes: List[str]) -> List[Content]:
+        return await self._per_node(self.list_services, nodes)
+
+    async def get_certificates_batch(self, nodes: List[str]) -> List[Content]:
+        return await self._per_node(self.get_certificates, nodes)
+
+    async def list_disks_batch(self, nodes: List[str]) -> List[Content]:
+        return await self._per_node(self.list_disks, nodes)
 
+    async def _per_node(self, fetch: Callable[..., Any], nodes: List[str]) -> List[Content]:
+        """Run a per-node listing for several nodes, up to ``NODE_FANOUT`` at once.
 
+        Returns a JSON object keyed by node of {"ok": true, "data": ...} or
+        {"ok": false, "status": ..., "error": ...}; one failing node does not
+        fail the others.
+        """
+        results = await self._gather_ok(
+            lambda node: fetch(node, raw=True), nodes, NODE_FANOUT, f"{fetch.__name__} on node"
+        )
+        return self._pack(dict(zip(nodes, results)))
@@ -1,5 +1,4 @@
 from typing import List
-import json
 from mcp.types import TextContent as Content
 from .base import ProxmoxTool
 
@@ -9,8 +8,15 @@ class BackupTools(ProxmoxTool):
         """Trigger a VZDump backup job.
 
         Maps to: POST /nodes/{node}/vzdump
+
+        A list ``vmid`` is joined into the comma-separated form the API
+        expects, so large guest sets go out as a single form field.
         """
-        result = self.proxmox.nodes(node).vzdump.post(**(params or {}))
-        return [Content(type="text", text=json.dumps({"task": result}))]
+        params = dict(params or {})
+        vmid = params.get("vmid")
+        if isinstance(vmid, (list, tuple)):
+            params["vmid"] = ",".join(str(v) for v in vmid)
+        result = self._node(node).vzdump.post(**params)
+        return self._pack({"task": result})
 
 
@@ -10,12 +10,46 @@ This module provides the foundation for all Proxmox MCP tools, including:
 All tool implementations inherit from the ProxmoxTool base class to ensure
 consistent behavior and error handling across the MCP server.
 """
+import asyncio
+import json
 import logging
-from typing import Any, Dict, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, TypeVar, Union
 from mcp.types import TextContent as Content
 from proxmoxer import ProxmoxAPI
 from ..formatting import ProxmoxTemplates
 
+try:  # optional: pip install "proxmox-mcp[fast]"
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+# Upper bound on cached per-node API resources (clusters rarely exceed this)
+_NODE_CACHE_SIZE = 64
+# Max concurrent per-node requests issued by _per_node_map and per-node batch tools
+NODE_FANOUT = 16
+
+_T = TypeVar("_T")
+
+
+def _dumps(obj: Any, indent: bool = False, sort_keys: bool = False) -> str:
+    """Serialize a tool result to JSON, preferring orjson when installed.
+
+    Output is compact unless ``indent`` is set (two-space indentation).
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, option=option).decode()
+        except TypeError:
+            pass  # e.g. integers wider than 64 bits; the stdlib encoder handles those
+    return json.dumps(obj, indent=2 if indent else None, sort_keys=sort_keys)
+
+
 class ProxmoxTool:
     """Base class for Proxmox MCP tools.
     
@@ -37,6 +71,65 @@ class ProxmoxTool:
         """
         self.proxmox = proxmox_api
         self.logger = logging.getLogger(f"proxmox-mcp.{self.__class__.__name__.lower()}")
+        self._nodes: Dict[str, Any] = {}
+        self._roots: Dict[str, Any] = {}
+
+    def _node(self, node: str) -> Any:
+        """Return the ``nodes(node)`` API resource, reusing it across calls.
+
+        proxmoxer resources are immutable path builders, so one per node can be
+        kept for the lifetime of the tool instead of being rebuilt per request.
+        """
+        resource = self._nodes.get(node)
+        if resource is None:
+            if len(self._nodes) >= _NODE_CACHE_SIZE:
+                self._nodes.clear()
+            resource = self._nodes[node] = self.proxmox.nodes(node)
+        return resource
+
+    def _root(self, path: str) -> Any:
+        """Return the API resource for a fixed path like ``cluster/ha``, built once."""
+        resource = self._roots.get(path)
+        if resource is None:
+            resource = self.proxmox
+            for segment in path.split("/"):
+                resource = getattr(resource, segment)
+            self._roots[path] = resource
+        return resource
+
+    def _per_node_map(self, fetch: Callable[[str], _T], nodes: Iterable[str]) -> List[_T]:
+        """Call ``fetch(node)`` for every node concurrently, returning results in order.
+
+        For synchronous tools that list something on each node: the HTTP
+        round trips overlap (up to ``NODE_FANOUT`` at once) over the pooled
+        session instead of adding up. The first exception is re-raised.
+        """
+        nodes = list(nodes)
+        if len(nodes) <= 1:
+            return [fetch(node) for node in nodes]
+        with ThreadPoolExecutor(max_workers=min(NODE_FANOUT, len(nodes))) as pool:
+            return list(pool.map(fetch, nodes))
+
+    async def _gather_ok(
+        self, fetch: Callable[[_T], Any], items: Iterable[_T], limit: int, what: str
+    ) -> List[Dict[str, Any]]:
+        """Call ``fetch(item)`` in worker threads, at most ``limit`` at a time.
+
+        Returns one entry per item, in order: {"ok": true, "data": ...} or
+        {"ok": false, "status": ..., "error": ...}. A failing item is logged
+        (as ``what`` plus the item) and does not fail the others.
+        """
+        semaphore = asyncio.Semaphore(limit)
+
+        async def run(item: _T) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    return {"ok": True, "data": await asyncio.to_thread(fetch, item)}
+                except Exception as e:
+                    self.logger.warning("%s %s failed: %s", what, item, e)
+                    return {"ok": False, "status": getattr(e, "status_code", None), "error": str(e)}
+
+        return list(await asyncio.gather(*(run(item) for item in items)))
 
     def _format_response(self, data: Any, resource_type: Optional[str] = None) -> List[Content]:
         """Format response data into MCP content using templates.
@@ -72,11 +165,29 @@ class ProxmoxTool:
             formatted = ProxmoxTemplates.cluster_status(data)
         else:
             # Fallback to JSON formatting for unknown types
-            import json
-            formatted = json.dumps(data, indent=2)
+            formatted = _dumps(data, indent=True)
 
         return [Content(type="text", text=formatted)]
 
+    def _pack(self, data: Any) -> List[Content]:
+        """Wrap JSON-serializable API data in a single MCP text content item.
+
+        Args:
+            data: Raw data from the Proxmox API (or a small result dict)
+
+        Returns:
+            List holding one Content object with the JSON-encoded data
+        """
+        return [Content(type="text", text=_dumps(data))]
+
+    def _ok(self, data: Any, raw: bool = False) -> Union[List[Content], Any]:
+        """Return API data as MCP content, or unchanged when ``raw`` is set.
+
+        In-process callers that want the Python object pass ``raw=True`` and
+        skip a JSON encode (and their own decode) entirely.
+        """
+        return data if raw else self._pack(data)
+
     def _handle_error(self, operation: str, error: Exception) -> None:
         """Handle and log errors from Proxmox operations.
 
@@ -94,13 +205,14 @@ class ProxmoxTool:
             RuntimeError: For unexpected errors or API failures
         """
         error_msg = str(error)
-        self.logger.error(f"Failed to {operation}: {error_msg}")
-
-        if "not found" in error_msg.lower():
-            raise ValueError(f"Resource not found: {error_msg}")
-        if "permission denied" in error_msg.lower():
-            raise ValueError(f"Permission denied: {error_msg}")
-        if "invalid" in error_msg.lower():
-            raise ValueError(f"Invalid input: {error_msg}")
-        
-        raise RuntimeError(f"Failed to {operation}: {error_msg}")
+        self.logger.error("Failed to %s: %s", operation, error_msg)
+
+        lowered = error_msg.lower()
+        if "not found" in lowered:
+            raise ValueError(f"Resource not found: {error_msg}") from error
+        if "permission denied" in lowered:
+            raise ValueError(f"Permission denied: {error_msg}") from error
+        if "invalid" in lowered:
+            raise ValueError(f"Invalid input: {error_msg}") from error
+
+        raise RuntimeError(f"Failed to {operation}: {error_msg}") from error
@@ -1,16 +1,15 @@
-from typing import List
-import json
+from typing import Any, List, Union
 from mcp.types import TextContent as Content
 from .base import ProxmoxTool
 
 
 class CephTools(ProxmoxTool):
-    def status(self, node: str) -> List[Content]:
-        result = self.proxmox.nodes(node).ceph.status.get()
-        return [Content(type="text", text=json.dumps(result))]
+    def status(self, node: str, raw: bool = False) -> Union[List[Content], Any]:
+        result = self._node(node).ceph.status.get()
+        return self._ok(result, raw)
 
-    def df(self, node: str) -> List[Content]:
-        result = self.proxmox.nodes(node).ceph.df.get()
-        return [Content(type="text", text=json.dumps(result))]
+    def df(self, node: str, raw: bool = False) -> Union[List[Content], Any]:
+        result = self._node(node).ceph.df.get()
+        return self._ok(result, raw)
 
 
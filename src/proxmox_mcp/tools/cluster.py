@@ -10,11 +10,22 @@ This module provides tools for monitoring and managing Proxmox clusters:
 The tools provide essential information for maintaining
 cluster health and ensuring proper operation.
 """
-from typing import List
-import json
+from typing import List, Optional
 from mcp.types import TextContent as Content
 from .base import ProxmoxTool
-from .definitions import GET_CLUSTER_STATUS_DESC
+
+# Sections of get_cluster_overview and the API path each one lists
+OVERVIEW_SECTIONS = {
+    "nodes": "nodes",
+    "storage": "storage",
+    "pools": "pools",
+    "ha_groups": "cluster/ha/groups",
+    "ha_resources": "cluster/ha/resources",
+    "sdn_zones": "cluster/sdn/zones",
+    "sdn_vnets": "cluster/sdn/vnets",
+    "replication": "cluster/replication",
+    "firewall_rules": "cluster/firewall/rules",
+}
 
 class ClusterTools(ProxmoxTool):
     """Tools for managing Proxmox cluster.
@@ -66,7 +77,7 @@ class ClusterTools(ProxmoxTool):
         """
         try:
             result = self.proxmox.cluster.status.get()
-            return [Content(type="text", text=json.dumps(result))]
+            return self._pack(result)
         except Exception as e:
             self._handle_error("get cluster status", e)
 
@@ -77,7 +88,7 @@ class ClusterTools(ProxmoxTool):
         """
         try:
             result = self.proxmox.cluster.resources.get()
-            return [Content(type="text", text=json.dumps(result))]
+            return self._pack(result)
         except Exception as e:
             self._handle_error("get cluster resources", e)
 
@@ -88,6 +99,29 @@ class ClusterTools(ProxmoxTool):
         """
         try:
             result = self.proxmox.version.get()
-            return [Content(type="text", text=json.dumps(result))]
+            return self._pack(result)
         except Exception as e:
             self._handle_error("get version", e)
+
+    async def get_cluster_overview(self, sections: Optional[List[str]] = None) -> List[Content]:
+        """Fetch several cluster-wide listings concurrently in one call.
+
+        Each section in ``OVERVIEW_SECTIONS`` (all of them by default) is
+        fetched in a worker thread; a failing section does not fail the rest.
+
+        Returns:
+            List[Content] containing a JSON object keyed by section of
+            {"ok": true, "data": ...} or {"ok": false, "status": ..., "error": ...}
+        """
+        names = list(dict.fromkeys(sections or OVERVIEW_SECTIONS))
+        unknown = [name for name in names if name not in OVERVIEW_SECTIONS]
+        if unknown:
+            raise ValueError(f"Invalid input: unknown sections {', '.join(unknown)}")
+
+        results = await self._gather_ok(
+            lambda name: self.proxmox.get(OVERVIEW_SECTIONS[name]),
+            names,
+            len(names),  # a handful of fixed sections; no need to throttle
+            "Overview section",
+        )
+        return self._pack(dict(zip(names, results)))
@@ -14,6 +14,7 @@ The module implements a robust command execution system with:
 - Comprehensive error handling
 """
 
+import asyncio
 import logging
 from typing import Dict, Any
 
@@ -86,60 +87,34 @@ class VMConsoleManager:
                        - API communication errors occur
         """
         try:
+            vm = self.proxmox.nodes(node).qemu(vmid)
             # Verify VM exists and is running
-            vm_status = self.proxmox.nodes(node).qemu(vmid).status.current.get()
+            # proxmoxer is blocking; keep the event loop free while it waits
+            vm_status = await asyncio.to_thread(vm.status.current.get)
             if vm_status["status"] != "running":
-                self.logger.error(f"Failed to execute command on VM {vmid}: VM is not running")
+                self.logger.error("Failed to execute command on VM %s: VM is not running", vmid)
                 raise ValueError(f"VM {vmid} on node {node} is not running")
 
-            # Get VM's console
-            self.logger.info(f"Executing command on VM {vmid} (node: {node}): {command}")
-            
-            # Execute the command using simple exec endpoint that returns result directly
-            try:
-                self.logger.info("Starting command execution...")
-                try:
-                    self.logger.debug(f"Executing command via agent: {command}")
-                    exec_result = self.proxmox.nodes(node).qemu(vmid).agent.exec.post(command=command)
-                    self.logger.debug(f"Raw exec response: {exec_result}")
-                    self.logger.info(f"Command executed with result: {exec_result}")
-                except Exception as e:
-                    self.logger.error(f"Failed to execute command: {str(e)}")
-                    raise RuntimeError(f"Failed to execute command: {str(e)}")
-
-            except Exception as e:
-                self.logger.error(f"API call failed: {str(e)}")
-                raise RuntimeError(f"API call failed: {str(e)}")
-
-            # Normalize result structure
-            if isinstance(exec_result, dict):
-                output = exec_result.get("out", "")
-                error = exec_result.get("err", "")
-                exit_code = exec_result.get("exitcode", 0)
-            else:
-                self.logger.debug(f"Unexpected exec_result type: {type(exec_result)}")
-                output = str(exec_result)
-                error = ""
-                exit_code = 0
-            
-            self.logger.debug(f"Processed output: {output}")
-            self.logger.debug(f"Processed error: {error}")
-            self.logger.debug(f"Processed exit code: {exit_code}")
-            
-            self.logger.debug(f"Executed command '{command}' on VM {vmid} (node: {node})")
+            self.logger.info("Executing command on VM %s (node: %s): %s", vmid, node, command)
+            # The agent exec endpoint returns {"out", "err", "exitcode"} directly
+            exec_result = await asyncio.to_thread(vm.agent.exec.post, command=command)
+            self.logger.debug("Raw exec response: %s", exec_result)
 
             return {
                 "success": True,
-                "output": output,
-                "error": error,
-                "exit_code": exit_code
+                "output": exec_result.get("out", ""),
+                "error": exec_result.get("err", ""),
+                "exit_code": exec_result.get("exitcode", 0),
             }
 
         except ValueError:
             # Re-raise ValueError for VM not running
             raise
         except Exception as e:
-            self.logger.error(f"Failed to execute command on VM {vmid}: {str(e)}")
-            if "not found" in str(e).lower():
-                raise ValueError(f"VM {vmid} not found on node {node}")
-            raise RuntimeError(f"Failed to execute command: {str(e)}")
+            self.logger.error("Failed to execute command on VM %s: %s", vmid, e)
+            status = getattr(e, "status_code", None)
+            # proxmoxer's ResourceException carries the HTTP status; only fall
+            # back to the message text for errors that don't
+            if status == 404 or (status is None and "not found" in str(e).lower()):
+                raise ValueError(f"VM {vmid} not found on node {node}") from e
+            raise RuntimeError(f"Failed to execute command: {e}") from e
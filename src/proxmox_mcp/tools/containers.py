@@ -1,7 +1,11 @@
-from typing import List, Dict, Optional, Tuple, Any, Union
-import json
+import asyncio
+from functools import lru_cache
+from typing import Callable, List, Dict, Optional, Tuple, Any, Union
 from mcp.types import TextContent as Content
-from .base import ProxmoxTool
+from .base import ProxmoxTool, _dumps
+
+# Max container power actions in flight per tool call
+ACTION_CONCURRENCY = 8
 
 
 def _b2h(n: Union[int, float, str]) -> str:
@@ -48,6 +52,35 @@ def _as_list(maybe: Any) -> List:
     return []
 
 
+@lru_cache(maxsize=1024)
+def _parse_selector(selector: str) -> Tuple[Tuple[str, str, str], ...]:
+    """Split a selector into (kind, node, value) terms; kind is vmid/node_vmid/node_name/name.
+
+    Agents repeat the same selectors a lot, so parsed forms are memoized.
+    Tokens like 'pve1:abc' that cannot name anything are dropped.
+    """
+    if selector.isdigit():
+        return (("vmid", "", selector),)
+    terms = []
+    for tok in selector.split(","):
+        tok = tok.strip()
+        if not tok:
+            continue
+        has_colon, has_slash = ":" in tok, "/" in tok
+        if has_colon and not has_slash:
+            node, _, vmid_s = tok.partition(":")
+            if vmid_s.strip().lstrip("+-").isdigit():
+                terms.append(("node_vmid", node, str(int(vmid_s))))
+        elif has_slash and not has_colon:
+            node, _, name = tok.partition("/")
+            terms.append(("node_name", node, name.strip()))
+        elif tok.isdigit():
+            terms.append(("vmid", "", tok))
+        else:
+            terms.append(("name", "", tok))
+    return tuple(terms)
+
+
 class ContainerTools(ProxmoxTool):
     """
     LXC container tools for Proxmox MCP.
@@ -62,21 +95,21 @@ class ContainerTools(ProxmoxTool):
     # ---------- error / output ----------
     def _json_fmt(self, data: Any) -> List[Content]:
         """Return raw JSON string (never touch project formatters)."""
-        return [Content(type="text", text=json.dumps(data, indent=2, sort_keys=True))]
+        return [Content(type="text", text=_dumps(data, indent=True, sort_keys=True))]
 
     def _err(self, action: str, e: Exception) -> List[Content]:
         if hasattr(self, "handle_error"):
             return self.handle_error(e, action)  # type: ignore[attr-defined]
         if hasattr(self, "_handle_error"):
             return self._handle_error(action, e)  # type: ignore[attr-defined]
-        return [Content(type="text", text=json.dumps({"error": str(e), "action": action}))]
+        return self._pack({"error": str(e), "action": action})
 
     # ---------- helpers ----------
     def _list_ct_pairs(self, node: Optional[str]) -> List[Tuple[str, Dict]]:
         """Yield (node_name, ct_dict). Coerce odd shapes into dicts with vmid."""
         out: List[Tuple[str, Dict]] = []
         if node:
-            raw = self.proxmox.nodes(node).lxc.get()
+            raw = self._node(node).lxc.get()
             for it in _as_list(raw):
                 if isinstance(it, dict):
                     out.append((node, it))
@@ -88,11 +121,9 @@ class ContainerTools(ProxmoxTool):
                         continue
         else:
             nodes = _as_list(self.proxmox.nodes.get())
-            for n in nodes:
-                nname = _get(n, "node")
-                if not nname:
-                    continue
-                raw = self.proxmox.nodes(nname).lxc.get()
+            names = [nname for nname in (_get(n, "node") for n in nodes) if nname]
+            listings = self._per_node_map(lambda nname: self._node(nname).lxc.get(), names)
+            for nname, raw in zip(names, listings):
                 for it in _as_list(raw):
                     if isinstance(it, dict):
                         out.append((nname, it))
@@ -107,7 +138,7 @@ class ContainerTools(ProxmoxTool):
     def _rrd_last(self, node: str, vmid: int) -> Tuple[Optional[float], Optional[int], Optional[int]]:
         """Return (cpu_pct, mem_bytes, maxmem_bytes) from the most recent RRD sample."""
         try:
-            rrd = _as_list(self.proxmox.nodes(node).lxc(vmid).rrddata.get(timeframe="hour", ds="cpu,mem,maxmem"))
+            rrd = _as_list(self._node(node).lxc(vmid).rrddata.get(timeframe="hour", ds="cpu,mem,maxmem"))
             if not rrd or not isinstance(rrd[-1], dict):
                 return None, None, None
             last = rrd[-1]
@@ -124,11 +155,11 @@ class ContainerTools(ProxmoxTool):
         raw_status: Dict = {}
         raw_config: Dict = {}
         try:
-            raw_status = _as_dict(self.proxmox.nodes(node).lxc(vmid).status.current.get())
+            raw_status = _as_dict(self._node(node).lxc(vmid).status.current.get())
         except Exception:
             raw_status = {}
         try:
-            raw_config = _as_dict(self.proxmox.nodes(node).lxc(vmid).config.get())
+            raw_config = _as_dict(self._node(node).lxc(vmid).config.get())
         except Exception:
             raw_config = {}
         return raw_status, raw_config
@@ -304,7 +335,7 @@ class ContainerTools(ProxmoxTool):
         Maps to: GET /nodes/{node}/lxc/{vmid}/status/current
         """
         try:
-            raw = self.proxmox.nodes(node).lxc(int(vmid)).status.current.get()
+            raw = self._node(node).lxc(int(vmid)).status.current.get()
             return self._json_fmt(raw)
         except Exception as e:
             return self._err(f"Failed to get container status {node}:{vmid}", e)
@@ -316,7 +347,7 @@ class ContainerTools(ProxmoxTool):
         Maps to: POST /nodes/{node}/lxc
         """
         try:
-            result = self.proxmox.nodes(node).lxc.post(**(config or {}))
+            result = self._node(node).lxc.post(**(config or {}))
             return self._json_fmt({"task": result})
         except Exception as e:
             return self._err(f"Failed to create container on {node}", e)
@@ -327,35 +358,35 @@ class ContainerTools(ProxmoxTool):
         Maps to: POST /nodes/{node}/lxc/{vmid}/config
         """
         try:
-            result = self.proxmox.nodes(node).lxc(int(vmid)).config.post(**(changes or {}))
+            result = self._node(node).lxc(int(vmid)).config.post(**(changes or {}))
             return self._json_fmt({"task": result})
         except Exception as e:
             return self._err(f"Failed to update container {node}:{vmid} config", e)
 
     def list_container_snapshots(self, node: str, vmid: int) -> List[Content]:
         try:
-            result = self.proxmox.nodes(node).lxc(int(vmid)).snapshot.get()
+            result = self._node(node).lxc(int(vmid)).snapshot.get()
             return self._json_fmt(result)
         except Exception as e:
             return self._err(f"Failed to list container snapshots {node}:{vmid}", e)
 
     def create_container_snapshot(self, node: str, vmid: int, snapname: str) -> List[Content]:
         try:
-            result = self.proxmox.nodes(node).lxc(int(vmid)).snapshot.post(snapname=snapname)
+            result = self._node(node).lxc(int(vmid)).snapshot.post(snapname=snapname)
             return self._json_fmt({"task": result})
         except Exception as e:
             return self._err(f"Failed to create container snapshot {node}:{vmid}:{snapname}", e)
 
     def delete_container_snapshot(self, node: str, vmid: int, snapname: str) -> List[Content]:
         try:
-            result = self.proxmox.nodes(node).lxc(int(vmid)).snapshot(snapname).delete()
+            result = self._node(node).lxc(int(vmid)).snapshot(snapname).delete()
             return self._json_fmt({"task": result})
         except Exception as e:
             return self._err(f"Failed to delete container snapshot {node}:{vmid}:{snapname}", e)
 
     def rollback_container_snapshot(self, node: str, vmid: int, snapname: str) -> List[Content]:
         try:
-            result = self.proxmox.nodes(node).lxc(int(vmid)).snapshot(snapname).rollback.post()
+            result = self._node(node).lxc(int(vmid)).snapshot(snapname).rollback.post()
             return self._json_fmt({"task": result})
         except Exception as e:
             return self._err(f"Failed to rollback container snapshot {node}:{vmid}:{snapname}", e)
@@ -371,50 +402,36 @@ class ContainerTools(ProxmoxTool):
           - 'name' (by name/hostname across the cluster)
           - comma-separated list of any of the above
         """
-        if not selector:
+        terms = _parse_selector(selector) if selector else ()
+        if not terms:
             return []
-        tokens = [t.strip() for t in selector.split(",") if t.strip()]
         inventory: List[Tuple[str, Dict[str, Any]]] = self._list_ct_pairs(node=None)
 
+        def label_of(ct: Dict[str, Any], vmid: int) -> str:
+            return _get(ct, "name") or _get(ct, "hostname") or f"ct-{vmid}"
+
         resolved: List[Tuple[str, int, str]] = []
-        for tok in tokens:
-            if ":" in tok and "/" not in tok:
-                node, vmid_s = tok.split(":", 1)
-                try:
-                    vmid = int(vmid_s)
-                except Exception:
-                    continue
+        for kind, node, value in terms:
+            if kind == "node_vmid":
+                vmid = int(value)
                 for n, ct in inventory:
                     if n == node and int(_get(ct, "vmid", -1)) == vmid:
-                        label = _get(ct, "name") or _get(ct, "hostname") or f"ct-{vmid}"
-                        resolved.append((node, vmid, label))
+                        resolved.append((node, vmid, label_of(ct, vmid)))
                         break
-                continue
-
-            if "/" in tok and ":" not in tok:
-                node, name = tok.split("/", 1)
-                name = name.strip()
+            elif kind == "vmid":
+                vmid = int(value)
+                for n, ct in inventory:
+                    if int(_get(ct, "vmid", -1)) == vmid:
+                        resolved.append((n, vmid, label_of(ct, vmid)))
+            else:
+                # node_name / name: match name or hostname, optionally on one node
                 for n, ct in inventory:
-                    if n == node and (_get(ct, "name") == name or _get(ct, "hostname") == name):
+                    if kind == "node_name" and n != node:
+                        continue
+                    if _get(ct, "name") == value or _get(ct, "hostname") == value:
                         vmid = int(_get(ct, "vmid", -1))
                         if vmid >= 0:
-                            resolved.append((node, vmid, name))
-                continue
-
-            if tok.isdigit():
-                vmid = int(tok)
-                for n, ct in inventory:
-                    if int(_get(ct, "vmid", -1)) == vmid:
-                        label = _get(ct, "name") or _get(ct, "hostname") or f"ct-{vmid}"
-                        resolved.append((n, vmid, label))
-                continue
-
-            name = tok
-            for n, ct in inventory:
-                if _get(ct, "name") == name or _get(ct, "hostname") == name:
-                    vmid = int(_get(ct, "vmid", -1))
-                    if vmid >= 0:
-                        resolved.append((n, vmid, name))
+                            resolved.append((n, vmid, value))
 
         uniq = {}
         for n, v, lbl in resolved:
@@ -434,82 +451,67 @@ class ContainerTools(ProxmoxTool):
         return [Content(type="text", text="\n".join(lines).rstrip())]
 
     # ---------- container control tools ----------
-    def start_container(self, selector: str, format_style: str = "pretty") -> List[Content]:
+    async def start_container(self, selector: str, format_style: str = "pretty") -> List[Content]:
         """
         Start LXC containers matching `selector`.
         selector examples: '123', 'pve1:123', 'pve1/name', 'name', 'pve1:101,pve2/web'
         """
-        try:
-            targets = self._resolve_targets(selector)
-            if not targets:
-                return self._err("No containers matched the selector", ValueError(selector))
+        def post(node: str, vmid: int) -> Any:
+            return self._node(node).lxc(vmid).status.start.post()
 
-            results: List[Dict[str, Any]] = []
-            for node, vmid, label in targets:
-                try:
-                    resp = self.proxmox.nodes(node).lxc(vmid).status.start.post()
-                    results.append({"ok": True, "node": node, "vmid": vmid, "name": label, "message": resp})
-                except Exception as e:
-                    results.append({"ok": False, "node": node, "vmid": vmid, "name": label, "error": str(e)})
+        return await self._power_action("start", "Start Containers", selector, format_style, post)
 
-            if format_style == "json":
-                return self._json_fmt(results)
-            return self._render_action_result("Start Containers", results)
-
-        except Exception as e:
-            return self._err("Failed to start container(s)", e)
-
-    def stop_container(self, selector: str, graceful: bool = True, timeout_seconds: int = 10,
-                       format_style: str = "pretty") -> List[Content]:
+    async def stop_container(self, selector: str, graceful: bool = True, timeout_seconds: int = 10,
+                             format_style: str = "pretty") -> List[Content]:
         """
         Stop LXC containers.
         graceful=True → POST .../status/shutdown (graceful stop)
         graceful=False → POST .../status/stop (force stop)
         """
-        try:
-            targets = self._resolve_targets(selector)
-            if not targets:
-                return self._err("No containers matched the selector", ValueError(selector))
+        def post(node: str, vmid: int) -> Any:
+            if graceful:
+                return self._node(node).lxc(vmid).status.shutdown.post(timeout=timeout_seconds)
+            return self._node(node).lxc(vmid).status.stop.post()
 
-            results: List[Dict[str, Any]] = []
-            for node, vmid, label in targets:
-                try:
-                    if graceful:
-                        resp = self.proxmox.nodes(node).lxc(vmid).status.shutdown.post(timeout=timeout_seconds)
-                    else:
-                        resp = self.proxmox.nodes(node).lxc(vmid).status.stop.post()
-                    results.append({"ok": True, "node": node, "vmid": vmid, "name": label, "message": resp})
-                except Exception as e:
-                    results.append({"ok": False, "node": node, "vmid": vmid, "name": label, "error": str(e)})
+        return await self._power_action("stop", "Stop Containers", selector, format_style, post)
 
-            if format_style == "json":
-                return self._json_fmt(results)
-            return self._render_action_result("Stop Containers", results)
+    async def restart_container(self, selector: str, timeout_seconds: int = 10,
+                                format_style: str = "pretty") -> List[Content]:
+        """
+        Restart LXC containers via POST .../status/reboot.
+        """
+        def post(node: str, vmid: int) -> Any:
+            return self._node(node).lxc(vmid).status.reboot.post()
 
-        except Exception as e:
-            return self._err("Failed to stop container(s)", e)
+        return await self._power_action("restart", "Restart Containers", selector, format_style, post)
 
-    def restart_container(self, selector: str, timeout_seconds: int = 10,
-                          format_style: str = "pretty") -> List[Content]:
+    async def _power_action(self, verb: str, title: str, selector: str, format_style: str,
+                            post: Callable[[str, int], Any]) -> List[Content]:
         """
-        Restart LXC containers via POST .../status/reboot.
+        Resolve `selector` and run `post(node, vmid)` for every target concurrently
+        (at most ACTION_CONCURRENCY in flight). Per-target failures are reported
+        in the result instead of failing the whole call.
         """
         try:
-            targets = self._resolve_targets(selector)
+            targets = await asyncio.to_thread(self._resolve_targets, selector)
             if not targets:
                 return self._err("No containers matched the selector", ValueError(selector))
 
-            results: List[Dict[str, Any]] = []
-            for node, vmid, label in targets:
-                try:
-                    resp = self.proxmox.nodes(node).lxc(vmid).status.reboot.post()
-                    results.append({"ok": True, "node": node, "vmid": vmid, "name": label, "message": resp})
-                except Exception as e:
-                    results.append({"ok": False, "node": node, "vmid": vmid, "name": label, "error": str(e)})
+            semaphore = asyncio.Semaphore(ACTION_CONCURRENCY)
+
+            async def run(node: str, vmid: int, label: str) -> Dict[str, Any]:
+                async with semaphore:
+                    try:
+                        resp = await asyncio.to_thread(post, node, vmid)
+                        return {"ok": True, "node": node, "vmid": vmid, "name": label, "message": resp}
+                    except Exception as e:
+                        return {"ok": False, "node": node, "vmid": vmid, "name": label, "error": str(e)}
+
+            results = list(await asyncio.gather(*(run(*target) for target in targets)))
 
             if format_style == "json":
                 return self._json_fmt(results)
-            return self._render_action_result("Restart Containers", results)
+            return self._render_action_result(title, results)
 
         except Exception as e:
-            return self._err("Failed to restart container(s)", e)
+            return self._err(f"Failed to {verb} container(s)", e)
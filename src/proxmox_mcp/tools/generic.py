@@ -5,10 +5,21 @@ Provides a single endpoint to call any Proxmox API path with a method and payloa
 Useful to cover the entire Proxmox API surface without bespoke wrappers for each.
 """
 from typing import Any, Dict, List, Optional
-import json
 from mcp.types import TextContent as Content
 from .base import ProxmoxTool
 
+# Upper bounds for batch_request: total size and requests in flight at once
+MAX_BATCH_SIZE = 100
+BATCH_CONCURRENCY = 8
+
+# HTTP method -> (ProxmoxAPI method name, whether ``data`` is merged into the payload)
+_METHODS = {
+    "GET": ("get", False),
+    "POST": ("post", True),
+    "PUT": ("put", True),
+    "DELETE": ("delete", False),
+}
+
 
 class GenericTools(ProxmoxTool):
     """Generic Proxmox API proxy methods."""
@@ -32,34 +43,58 @@ class GenericTools(ProxmoxTool):
             List[Content] containing JSON string of response
         """
         try:
-            if not isinstance(path, str) or not path:
-                raise ValueError("path must be a non-empty string")
-
-            # Normalize path (strip leading slashes or api2/json prefix if given)
-            norm = path.lstrip("/")
-            if norm.startswith("api2/json/"):
-                norm = norm[len("api2/json/") :]
-
-            method_upper = (method or "").upper()
-            params = params or {}
-            data = data or {}
-
-            # Merge params+data for write operations; GET keeps params only
-            write_payload = {**params, **data}
-
-            if method_upper == "GET":
-                result = self.proxmox.get(norm, **params)
-            elif method_upper == "POST":
-                result = self.proxmox.post(norm, **write_payload)
-            elif method_upper == "PUT":
-                result = self.proxmox.put(norm, **write_payload)
-            elif method_upper == "DELETE":
-                result = self.proxmox.delete(norm, **params)
-            else:
-                raise ValueError("Unsupported method. Use GET, POST, PUT or DELETE")
-
-            return [Content(type="text", text=json.dumps(result))]
+            result = self._request(method, path, params, data)
+            return self._pack(result)
         except Exception as e:
             self._handle_error(f"generic request {method} {path}", e)
 
+    async def batch_request(self, requests: List[Dict[str, Any]]) -> List[Content]:
+        """Call several Proxmox API endpoints concurrently.
+
+        Each request runs in a worker thread over the shared proxmoxer session,
+        with at most ``BATCH_CONCURRENCY`` in flight. A failing request does not
+        abort the batch; its entry reports the error instead.
+
+        Args:
+            requests: List of {"method", "path", "params", "data"} dicts
+
+        Returns:
+            List[Content] containing a JSON list, in request order, of
+            {"ok": true, "data": ...} or {"ok": false, "status": ..., "error": ...}
+        """
+        if len(requests) > MAX_BATCH_SIZE:
+            raise ValueError(f"Invalid input: at most {MAX_BATCH_SIZE} requests per batch")
+
+        results = await self._gather_ok(
+            lambda r: self._request(r.get("method"), r.get("path"), r.get("params"), r.get("data")),
+            requests,
+            BATCH_CONCURRENCY,
+            "Batch request",
+        )
+        return self._pack(results)
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """Dispatch a single request and return the decoded response data."""
+        if not isinstance(path, str) or not path:
+            raise ValueError("path must be a non-empty string")
+
+        try:
+            op, is_write = _METHODS[(method or "").upper()]
+        except KeyError:
+            raise ValueError("Unsupported method. Use GET, POST, PUT or DELETE") from None
+
+        # Normalize path (strip leading slashes or api2/json prefix if given)
+        norm = path.lstrip("/").removeprefix("api2/json/")
 
+        # Merge params+data for write operations; GET/DELETE send params only.
+        # Only allocate a merged dict when both actually carry values.
+        payload = params or {}
+        if is_write and data:
+            payload = {**payload, **data} if payload else data
+        return getattr(self.proxmox, op)(norm, **payload)
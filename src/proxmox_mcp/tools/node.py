@@ -13,10 +13,8 @@ The tools handle both basic and detailed node information retrieval,
 with fallback mechanisms for partial data availability.
 """
 from typing import List
-import json
 from mcp.types import TextContent as Content
 from .base import ProxmoxTool
-from .definitions import GET_NODES_DESC, GET_NODE_STATUS_DESC
 
 class NodeTools(ProxmoxTool):
     """Tools for managing Proxmox nodes.
@@ -61,7 +59,7 @@ class NodeTools(ProxmoxTool):
         """
         try:
             result = self.proxmox.nodes.get()
-            return [Content(type="text", text=json.dumps(result))]
+            return self._pack(result)
         except Exception as e:
             self._handle_error("get nodes", e)
 
@@ -100,8 +98,8 @@ class NodeTools(ProxmoxTool):
             RuntimeError: If status retrieval fails (node offline, network issues)
         """
         try:
-            result = self.proxmox.nodes(node).status.get()
-            return [Content(type="text", text=json.dumps(result))]
+            result = self._node(node).status.get()
+            return self._pack(result)
         except Exception as e:
             self._handle_error(f"get status for node {node}", e)
 
@@ -111,18 +109,21 @@ class NodeTools(ProxmoxTool):
         Maps to: GET /nodes/{node}/tasks/{upid}/status
         """
         try:
-            result = self.proxmox.nodes(node).tasks(upid).status.get()
-            return [Content(type="text", text=json.dumps(result))]
+            result = self._node(node).tasks(upid).status.get()
+            return self._pack(result)
         except Exception as e:
             self._handle_error(f"get task status {upid} on node {node}", e)
 
-    def get_task_log(self, node: str, upid: str) -> List[Content]:
-        """Get task log by UPID.
+    def get_task_log(self, node: str, upid: str, start: int = 0, limit: int = 500) -> List[Content]:
+        """Get task log by UPID, one page of lines at a time.
 
         Maps to: GET /nodes/{node}/tasks/{upid}/log
+
+        Long-running tasks (vzdump, migration) can produce megabytes of log,
+        so only ``limit`` lines starting at line ``start`` are fetched.
         """
         try:
-            result = self.proxmox.nodes(node).tasks(upid).log.get()
-            return [Content(type="text", text=json.dumps(result))]
+            result = self._node(node).tasks(upid).log.get(start=start, limit=limit)
+            return self._pack(result)
         except Exception as e:
             self._handle_error(f"get task log {upid} on node {node}", e)
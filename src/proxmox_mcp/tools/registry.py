@@ -0,0 +1,371 @@
+"""
+Declarative MCP tool table for the Proxmox MCP server.
+
+Each tool is described by a :class:`ToolSpec` naming its description
+constant, its parameter model (see :mod:`proxmox_mcp.tools.schemas`) and
+the tool method it dispatches to.
+"""
+from typing import Any, Callable, Dict, NamedTuple, Optional, Type
+
+from mcp.server.fastmcp.utilities.func_metadata import ArgModelBase
+
+from .schemas import (
+    NoParams,
+    NodeParams,
+    NodesParams,
+    NodeUpidParams,
+    TaskLogParams,
+    NodeVmidParams,
+    VmPowerBatchParams,
+    DeleteVmParams,
+    CreateVmParams,
+    VmCommandParams,
+    VmSnapshotParams,
+    CreateVmSnapshotParams,
+    CloneVmParams,
+    MigrateVmParams,
+    VmConfigParams,
+    VmDiskParams,
+    ResizeDiskParams,
+    MoveDiskParams,
+    ImportDiskParams,
+    AttachDiskParams,
+    NodeStorageParams,
+    ClusterOverviewParams,
+    StorageContentParams,
+    StorageVolumeParams,
+    UploadParams,
+    UserParams,
+    CreateUserParams,
+    UpdateUserParams,
+    GroupParams,
+    CreateGroupParams,
+    RoleParams,
+    CreateRoleParams,
+    SetAclParams,
+    FirewallRuleParams,
+    FirewallPosParams,
+    PoolParams,
+    CreatePoolParams,
+    VzdumpParams,
+    ServiceActionParams,
+    HaGroupParams,
+    HaSidParams,
+    HaResourceParams,
+    ReplJobParams,
+    ReplJobIdParams,
+    CreateContainerParams,
+    NodeCtParams,
+    ContainerConfigParams,
+    CtSnapshotParams,
+    StartContainerParams,
+    StopContainerParams,
+    RestartContainerParams,
+    ProxmoxRequestParams,
+    BatchProxmoxParams,
+)
+
+
+# Argument adapters for tools whose method signature differs from their params
+
+def _json_format(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    return {**kwargs, "format_style": "json"}
+
+
+def _unpack_payload(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    return kwargs["payload"]
+
+
+class ToolSpec(NamedTuple):
+    """Registration entry for one MCP tool."""
+
+    name: str
+    # Name of the description constant in proxmox_mcp.tools.definitions
+    description: str
+    params: Type[ArgModelBase]
+    # "<server tool attribute>.<method>", e.g. "vm_tools.start_vm"
+    target: str
+    is_async: bool = False
+    # Maps validated arguments to the target method's keyword arguments
+    adapt: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None
+    # Side-effect free; results may be served from the short-lived result cache
+    read_only: bool = False
+    # Cache lifetime as a multiple of PROXMOX_MCP_CACHE_TTL, for slow-changing data;
+    # 0 never caches but still coalesces concurrent identical calls
+    cache_scale: int = 1
+
+
+TOOLS = (
+    # Node tools
+    ToolSpec("get_nodes", "GET_NODES_DESC", NoParams, "node_tools.get_nodes", read_only=True),
+    ToolSpec(
+        "get_node_status", "GET_NODE_STATUS_DESC", NodeParams, "node_tools.get_node_status",
+        read_only=True,
+    ),
+    ToolSpec(
+        "get_task_status", "GET_TASK_STATUS_DESC", NodeUpidParams, "node_tools.get_task_status",
+        read_only=True, cache_scale=0,
+    ),
+    ToolSpec(
+        "get_task_log", "GET_TASK_LOG_DESC", TaskLogParams, "node_tools.get_task_log",
+        read_only=True, cache_scale=0,
+    ),
+    # VM tools
+    ToolSpec(
+        "get_vms", "GET_VMS_DESC", NoParams, "vm_tools.get_vms", read_only=True, cache_scale=2,
+    ),
+    ToolSpec(
+        "get_vm_status", "GET_VM_STATUS_DESC", NodeVmidParams, "vm_tools.get_vm_status",
+        read_only=True,
+    ),
+    ToolSpec(
+        "get_vm_snapshots", "GET_VM_SNAPSHOTS_DESC", NodeVmidParams, "vm_tools.get_vm_snapshots",
+        read_only=True, cache_scale=5,
+    ),
+    ToolSpec("create_vm", "CREATE_VM_DESC", CreateVmParams, "vm_tools.create_vm"),
+    ToolSpec(
+        "execute_vm_command", "EXECUTE_VM_COMMAND_DESC", VmCommandParams,
+        "vm_tools.execute_command", is_async=True,
+    ),
+    ToolSpec("start_vm", "START_VM_DESC", NodeVmidParams, "vm_tools.start_vm"),
+    ToolSpec("stop_vm", "STOP_VM_DESC", NodeVmidParams, "vm_tools.stop_vm"),
+    ToolSpec("shutdown_vm", "SHUTDOWN_VM_DESC", NodeVmidParams, "vm_tools.shutdown_vm"),
+    ToolSpec("reset_vm", "RESET_VM_DESC", NodeVmidParams, "vm_tools.reset_vm"),
+    ToolSpec(
+        "vm_power_batch", "VM_POWER_BATCH_DESC", VmPowerBatchParams, "vm_tools.vm_power_batch",
+        is_async=True,
+    ),
+    ToolSpec("delete_vm", "DELETE_VM_DESC", DeleteVmParams, "vm_tools.delete_vm"),
+    ToolSpec(
+        "create_vm_snapshot", "CREATE_VM_SNAPSHOT_DESC", CreateVmSnapshotParams,
+        "vm_tools.create_vm_snapshot",
+    ),
+    ToolSpec(
+        "delete_vm_snapshot", "DELETE_VM_SNAPSHOT_DESC", VmSnapshotParams,
+        "vm_tools.delete_vm_snapshot",
+    ),
+    ToolSpec(
+        "rollback_vm_snapshot", "ROLLBACK_VM_SNAPSHOT_DESC", VmSnapshotParams,
+        "vm_tools.rollback_vm_snapshot",
+    ),
+    ToolSpec("clone_vm", "CLONE_VM_DESC", CloneVmParams, "vm_tools.clone_vm"),
+    ToolSpec("migrate_vm", "MIGRATE_VM_DESC", MigrateVmParams, "vm_tools.migrate_vm"),
+    ToolSpec(
+        "update_vm_config", "UPDATE_VM_CONFIG_DESC", VmConfigParams, "vm_tools.update_vm_config",
+    ),
+    ToolSpec("resize_vm_disk", "RESIZE_VM_DISK_DESC", ResizeDiskParams, "vm_tools.resize_vm_disk"),
+    ToolSpec("vm_vncproxy", "VM_VNCPROXY_DESC", NodeVmidParams, "vm_tools.vncproxy"),
+    ToolSpec("vm_spiceproxy", "VM_SPICEPROXY_DESC", NodeVmidParams, "vm_tools.spiceproxy"),
+    ToolSpec("vm_move_disk", "VM_MOVE_DISK_DESC", MoveDiskParams, "vm_tools.move_disk"),
+    ToolSpec("vm_import_disk", "VM_IMPORT_DISK_DESC", ImportDiskParams, "vm_tools.import_disk"),
+    ToolSpec("vm_attach_disk", "VM_ATTACH_DISK_DESC", AttachDiskParams, "vm_tools.attach_disk"),
+    ToolSpec("vm_detach_disk", "VM_DETACH_DISK_DESC", VmDiskParams, "vm_tools.detach_disk"),
+    # Storage tools
+    ToolSpec(
+        "get_storage", "GET_STORAGE_DESC", NoParams, "storage_tools.get_storage", read_only=True,
+    ),
+    ToolSpec(
+        "get_storage_content", "GET_STORAGE_CONTENT_DESC", StorageContentParams,
+        "storage_tools.get_storage_content", read_only=True,
+    ),
+    # Cluster tools
+    ToolSpec(
+        "get_cluster_status", "GET_CLUSTER_STATUS_DESC", NoParams,
+        "cluster_tools.get_cluster_status", read_only=True,
+    ),
+    ToolSpec(
+        "get_cluster_resources", "GET_CLUSTER_RESOURCES_DESC", NoParams,
+        "cluster_tools.get_cluster_resources", read_only=True,
+    ),
+    ToolSpec(
+        "get_cluster_overview", "GET_CLUSTER_OVERVIEW_DESC", ClusterOverviewParams,
+        "cluster_tools.get_cluster_overview", is_async=True, read_only=True,
+    ),
+    ToolSpec(
+        "get_version", "GET_VERSION_DESC", NoParams, "cluster_tools.get_version", read_only=True,
+        cache_scale=30,
+    ),
+    # Access control
+    ToolSpec(
+        "list_users", "LIST_USERS_DESC", NoParams, "access_tools.list_users", read_only=True,
+        cache_scale=10,
+    ),
+    ToolSpec("create_user", "CREATE_USER_DESC", CreateUserParams, "access_tools.create_user"),
+    ToolSpec("update_user", "UPDATE_USER_DESC", UpdateUserParams, "access_tools.update_user"),
+    ToolSpec("delete_user", "DELETE_USER_DESC", UserParams, "access_tools.delete_user"),
+    ToolSpec(
+        "list_groups", "LIST_GROUPS_DESC", NoParams, "access_tools.list_groups", read_only=True,
+        cache_scale=10,
+    ),
+    ToolSpec("create_group", "CREATE_GROUP_DESC", CreateGroupParams, "access_tools.create_group"),
+    ToolSpec("delete_group", "DELETE_GROUP_DESC", GroupParams, "access_tools.delete_group"),
+    ToolSpec(
+        "list_roles", "LIST_ROLES_DESC", NoParams, "access_tools.list_roles", read_only=True,
+        cache_scale=10,
+    ),
+    ToolSpec("create_role", "CREATE_ROLE_DESC", CreateRoleParams, "access_tools.create_role"),
+    ToolSpec("delete_role", "DELETE_ROLE_DESC", RoleParams, "access_tools.delete_role"),
+    ToolSpec(
+        "get_acl", "GET_ACL_DESC", NoParams, "access_tools.get_acl", read_only=True, cache_scale=10,
+    ),
+    ToolSpec("set_acl", "SET_ACL_DESC", SetAclParams, "access_tools.set_acl"),
+    # Datacenter firewall
+    ToolSpec(
+        "list_dc_firewall_rules", "LIST_DC_FW_RULES_DESC", NoParams, "firewall_tools.list_dc_rules",
+        read_only=True, cache_scale=10,
+    ),
+    ToolSpec(
+        "add_dc_firewall_rule", "ADD_DC_FW_RULE_DESC", FirewallRuleParams,
+        "firewall_tools.add_dc_rule",
+    ),
+    ToolSpec(
+        "delete_dc_firewall_rule", "DELETE_DC_FW_RULE_DESC", FirewallPosParams,
+        "firewall_tools.delete_dc_rule",
+    ),
+    # Pools
+    ToolSpec(
+        "list_pools", "LIST_POOLS_DESC", NoParams, "pool_tools.list_pools", read_only=True,
+        cache_scale=10,
+    ),
+    ToolSpec("create_pool", "CREATE_POOL_DESC", CreatePoolParams, "pool_tools.create_pool"),
+    ToolSpec("delete_pool", "DELETE_POOL_DESC", PoolParams, "pool_tools.delete_pool"),
+    # Backups
+    ToolSpec("vzdump", "VZDUMP_DESC", VzdumpParams, "backup_tools.vzdump"),
+    # Node admin
+    ToolSpec(
+        "list_services", "LIST_SERVICES_DESC", NodeParams, "admin_tools.list_services",
+        read_only=True,
+    ),
+    ToolSpec(
+        "service_action", "SERVICE_ACTION_DESC", ServiceActionParams, "admin_tools.service_action",
+    ),
+    ToolSpec(
+        "network_get", "NETWORK_GET_DESC", NodeParams, "admin_tools.network_get", read_only=True,
+        cache_scale=10,
+    ),
+    ToolSpec("network_apply", "NETWORK_APPLY_DESC", NodeParams, "admin_tools.network_apply"),
+    ToolSpec(
+        "list_updates", "LIST_UPDATES_DESC", NodeParams, "admin_tools.list_updates", read_only=True,
+    ),
+    ToolSpec(
+        "list_repositories", "LIST_REPOS_DESC", NodeParams, "admin_tools.list_repositories",
+        read_only=True, cache_scale=10,
+    ),
+    ToolSpec(
+        "get_certificates", "GET_CERTS_DESC", NodeParams, "admin_tools.get_certificates",
+        read_only=True, cache_scale=10,
+    ),
+    ToolSpec("list_disks", "LIST_DISKS_DESC", NodeParams, "admin_tools.list_disks", read_only=True),
+    ToolSpec(
+        "list_services_batch", "LIST_SERVICES_BATCH_DESC", NodesParams,
+        "admin_tools.list_services_batch", is_async=True, read_only=True,
+    ),
+    ToolSpec(
+        "get_certificates_batch", "GET_CERTS_BATCH_DESC", NodesParams,
+        "admin_tools.get_certificates_batch", is_async=True, read_only=True, cache_scale=10,
+    ),
+    ToolSpec(
+        "list_disks_batch", "LIST_DISKS_BATCH_DESC", NodesParams, "admin_tools.list_disks_batch",
+        is_async=True, read_only=True,
+    ),
+    # HA
+    ToolSpec(
+        "ha_list_groups", "HA_LIST_GROUPS_DESC", NoParams, "ha_tools.list_groups", read_only=True,
+        cache_scale=10,
+    ),
+    ToolSpec("ha_create_group", "HA_CREATE_GROUP_DESC", HaGroupParams, "ha_tools.create_group"),
+    ToolSpec(
+        "ha_list_resources", "HA_LIST_RESOURCES_DESC", NoParams, "ha_tools.list_resources",
+        read_only=True, cache_scale=10,
+    ),
+    ToolSpec("ha_add_resource", "HA_ADD_RESOURCE_DESC", HaResourceParams, "ha_tools.add_resource"),
+    ToolSpec(
+        "ha_delete_resource", "HA_DELETE_RESOURCE_DESC", HaSidParams, "ha_tools.delete_resource",
+    ),
+    # Replication
+    ToolSpec(
+        "replication_list_jobs", "REPL_LIST_JOBS_DESC", NoParams, "repl_tools.list_jobs",
+        read_only=True, cache_scale=30,
+    ),
+    ToolSpec(
+        "replication_create_job", "REPL_CREATE_JOB_DESC", ReplJobParams, "repl_tools.create_job",
+    ),
+    ToolSpec(
+        "replication_delete_job", "REPL_DELETE_JOB_DESC", ReplJobIdParams, "repl_tools.delete_job",
+    ),
+    # SDN
+    ToolSpec(
+        "sdn_list_zones", "SDN_LIST_ZONES_DESC", NoParams, "sdn_tools.list_zones", read_only=True,
+        cache_scale=10,
+    ),
+    ToolSpec(
+        "sdn_list_vnets", "SDN_LIST_VNETS_DESC", NoParams, "sdn_tools.list_vnets", read_only=True,
+        cache_scale=10,
+    ),
+    # Ceph
+    ToolSpec("ceph_status", "CEPH_STATUS_DESC", NodeParams, "ceph_tools.status", read_only=True),
+    ToolSpec("ceph_df", "CEPH_DF_DESC", NodeParams, "ceph_tools.df", read_only=True),
+    # Storage content ops
+    ToolSpec(
+        "delete_storage_content", "DELETE_STORAGE_CONTENT_DESC", StorageVolumeParams,
+        "storage_tools.delete_storage_content",
+    ),
+    ToolSpec(
+        "upload_storage_content", "UPLOAD_STORAGE_CONTENT_DESC", UploadParams,
+        "storage_tools.upload_storage_content",
+    ),
+    # Containers (LXC)
+    ToolSpec(
+        "get_containers", "GET_CONTAINERS_DESC", NoParams, "container_tools.get_containers",
+        adapt=_json_format, read_only=True,
+    ),
+    ToolSpec(
+        "get_container_status", "GET_CONTAINER_STATUS_DESC", NodeVmidParams,
+        "container_tools.get_container_status",
+    ),
+    ToolSpec(
+        "create_container", "CREATE_CONTAINER_DESC", CreateContainerParams,
+        "container_tools.create_container",
+    ),
+    ToolSpec(
+        "update_container_config", "UPDATE_CONTAINER_CONFIG_DESC", ContainerConfigParams,
+        "container_tools.update_container_config",
+    ),
+    ToolSpec(
+        "list_container_snapshots", "LIST_CONTAINER_SNAPSHOTS_DESC", NodeCtParams,
+        "container_tools.list_container_snapshots",
+    ),
+    ToolSpec(
+        "create_container_snapshot", "CREATE_CONTAINER_SNAPSHOT_DESC", CtSnapshotParams,
+        "container_tools.create_container_snapshot",
+    ),
+    ToolSpec(
+        "delete_container_snapshot", "DELETE_CONTAINER_SNAPSHOT_DESC", CtSnapshotParams,
+        "container_tools.delete_container_snapshot",
+    ),
+    ToolSpec(
+        "rollback_container_snapshot", "ROLLBACK_CONTAINER_SNAPSHOT_DESC", CtSnapshotParams,
+        "container_tools.rollback_container_snapshot",
+    ),
+    ToolSpec(
+        "start_container", "START_CONTAINER_DESC", StartContainerParams,
+        "container_tools.start_container", is_async=True,
+    ),
+    ToolSpec(
+        "stop_container", "STOP_CONTAINER_DESC", StopContainerParams,
+        "container_tools.stop_container", is_async=True,
+    ),
+    ToolSpec(
+        "restart_container", "RESTART_CONTAINER_DESC", RestartContainerParams,
+        "container_tools.restart_container", is_async=True,
+    ),
+    # Generic Proxmox proxy
+    ToolSpec(
+        "proxmox_request", "PROXMOX_REQUEST_DESC", ProxmoxRequestParams,
+        "generic_tools.proxmox_request", adapt=_unpack_payload,
+    ),
+    ToolSpec(
+        "batch_proxmox", "BATCH_PROXMOX_DESC", BatchProxmoxParams, "generic_tools.batch_request",
+        is_async=True,
+    ),
+)
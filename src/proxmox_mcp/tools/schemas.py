@@ -0,0 +1,380 @@
+"""
+Parameter models and JSON schemas for the Proxmox MCP tools.
+
+Tools with the same signature share one model, so e.g. every
+``(node, vmid)`` tool validates against :class:`NodeVmidParams`. Schemas
+are generated once per model and process via :func:`json_schema`, so
+further server instances (and tools sharing a model) reuse the same dict.
+
+Plain identifier fields (``node``, ``vmid``, ...) are declared without
+``Field`` metadata to keep validators cheap; their schema descriptions come
+from :data:`PARAM_DESCRIPTIONS` instead.
+"""
+import functools
+from typing import Annotated, Any, Dict, List, Literal, Optional, Type
+
+from mcp.server.fastmcp.utilities.func_metadata import ArgModelBase
+from pydantic import BaseModel, BeforeValidator, Field
+from typing_extensions import NotRequired, TypedDict
+
+try:  # optional: pip install "proxmox-mcp[fast]"
+    from orjson import loads as _loads
+except ImportError:  # pragma: no cover - depends on the environment
+    from json import loads as _loads
+
+
+# Descriptions for fields declared as bare types
+PARAM_DESCRIPTIONS = {
+    "node": "Host node name (e.g. 'pve1', 'proxmox-node2')",
+    "upid": "Task UPID",
+    "vmid": "VM ID number (e.g. '100', '101')",
+    "snapname": "Snapshot name",
+    "storage": "Storage ID (e.g. 'local', 'local-lvm')",
+    "volume": "Volume ID",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def json_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    """Return the (cached) JSON schema advertised for a parameter model."""
+    schema = model.model_json_schema(by_alias=True)
+    for name, prop in schema.get("properties", {}).items():
+        if "description" not in prop and name in PARAM_DESCRIPTIONS:
+            prop["description"] = PARAM_DESCRIPTIONS[name]
+    return schema
+
+
+class NoParams(ArgModelBase):
+    pass
+
+
+class NodeParams(ArgModelBase):
+    node: str
+
+
+class NodesParams(ArgModelBase):
+    nodes: Annotated[
+        List[str],
+        Field(description="Node names (e.g. ['pve1', 'pve2'])", min_length=1, max_length=64),
+    ]
+
+
+class NodeUpidParams(NodeParams):
+    upid: str
+
+
+class TaskLogParams(NodeUpidParams):
+    start: Annotated[int, Field(description="First log line to return (0-based)", ge=0)] = 0
+    limit: Annotated[
+        int,
+        Field(description="Maximum number of log lines to return", ge=1, le=5000),
+    ] = 500
+
+
+class NodeVmidParams(NodeParams):
+    vmid: str
+
+
+class VmPowerBatchParams(ArgModelBase):
+    action: Annotated[
+        Literal["start", "stop", "shutdown", "reset"],
+        Field(description="Power action"),
+    ]
+    vmids: Annotated[
+        List[str],
+        Field(description="VM ID numbers (e.g. ['100', '101'])", min_length=1, max_length=100),
+    ]
+
+
+class DeleteVmParams(NodeVmidParams):
+    force: Annotated[bool, Field(description="Force deletion even if VM is running")] = False
+
+
+class CreateVmParams(NodeParams):
+    vmid: Annotated[str, Field(description="New VM ID number (e.g. '200', '300')")]
+    name: Annotated[str, Field(description="VM name (e.g. 'my-new-vm', 'web-server')")]
+    cpus: Annotated[int, Field(description="Number of CPU cores (e.g. 1, 2, 4)", ge=1, le=32)]
+    memory: Annotated[
+        int,
+        Field(description="Memory size in MB (e.g. 2048 for 2GB)", ge=512, le=131072),
+    ]
+    disk_size: Annotated[int, Field(description="Disk size in GB (e.g. 10, 20, 50)", ge=5, le=1000)]
+    storage: Annotated[
+        Optional[str],
+        Field(description="Storage name (optional, will auto-detect)"),
+    ] = None
+    ostype: Annotated[
+        Optional[str],
+        Field(description="OS type (optional, default: 'l26' for Linux)"),
+    ] = None
+
+
+class VmCommandParams(NodeVmidParams):
+    command: Annotated[
+        str,
+        Field(description="Shell command to run (e.g. 'uname -a', 'systemctl status nginx')"),
+    ]
+
+
+class VmSnapshotParams(NodeVmidParams):
+    snapname: str
+
+
+class CreateVmSnapshotParams(VmSnapshotParams):
+    vmstate: Annotated[Optional[bool], Field(description="Include RAM state")] = None
+    description: Annotated[Optional[str], Field(description="Snapshot description")] = None
+
+
+class CloneVmParams(NodeVmidParams):
+    target: Annotated[Optional[str], Field(description="Target node")] = None
+    newid: Annotated[Optional[str], Field(description="New VM ID")] = None
+    name: Annotated[Optional[str], Field(description="New VM name")] = None
+    full: Annotated[Optional[bool], Field(description="Full clone")] = None
+    storage: Annotated[Optional[str], Field(description="Target storage")] = None
+
+
+class MigrateVmParams(NodeVmidParams):
+    target: Annotated[str, Field(description="Target node")]
+    online: Annotated[Optional[bool], Field(description="Online migration")] = None
+
+
+class VmConfigParams(NodeVmidParams):
+    changes: Annotated[dict, Field(description="Config changes")]
+
+
+class VmDiskParams(NodeVmidParams):
+    disk: Annotated[str, Field(description="Disk slot (e.g. 'scsi0')")]
+
+
+class ResizeDiskParams(VmDiskParams):
+    size: Annotated[str, Field(description="Resize (e.g. '+10G')")]
+
+
+class MoveDiskParams(VmDiskParams):
+    storage: Annotated[str, Field(description="Target storage")]
+
+
+class ImportDiskParams(NodeVmidParams):
+    source: Annotated[str, Field(description="Source path")]
+    storage: Annotated[str, Field(description="Target storage")]
+
+
+class AttachDiskParams(VmDiskParams):
+    opts: Annotated[dict, Field(description="Disk options (e.g., 'local-lvm:10,format=raw')")]
+
+
+class NodeStorageParams(NodeParams):
+    storage: str
+
+
+class StorageContentParams(NodeStorageParams):
+    content: Annotated[
+        Optional[str],
+        Field(description="Only list this content type: images|rootdir|iso|vztmpl|backup|snippets"),
+    ] = None
+    vmid: Annotated[
+        Optional[str],
+        Field(description="Only list volumes owned by this VM/container ID"),
+    ] = None
+
+
+class StorageVolumeParams(NodeStorageParams):
+    volume: str
+
+
+class UploadParams(NodeStorageParams):
+    content: Annotated[str, Field(description="Content type: iso|vztmpl|backup")]
+    file_path: Annotated[str, Field(description="Local file path")]
+    filename: Annotated[str, Field(description="Target filename")]
+    chunk_size: Annotated[
+        int,
+        Field(description="Bytes read from disk per chunk", ge=4096, le=16 * 1024 * 1024),
+    ] = 1024 * 1024
+
+
+class UserParams(ArgModelBase):
+    user: Annotated[str, Field(description="User ID, e.g. 'user@pve'")]
+
+
+class CreateUserParams(UserParams):
+    password: Annotated[Optional[str], Field(description="Password")] = None
+    comment: Annotated[Optional[str], Field(description="Comment")] = None
+    expire: Annotated[Optional[int], Field(description="Expiry epoch")] = None
+    enable: Annotated[Optional[bool], Field(description="Enable user")] = True
+
+
+class UpdateUserParams(UserParams):
+    changes: Annotated[dict, Field(description="Changes")]
+
+
+class GroupParams(ArgModelBase):
+    groupid: Annotated[str, Field(description="Group ID")]
+
+
+class CreateGroupParams(GroupParams):
+    comment: Annotated[Optional[str], Field(description="Comment")] = None
+
+
+class RoleParams(ArgModelBase):
+    roleid: Annotated[str, Field(description="Role ID")]
+
+
+class CreateRoleParams(RoleParams):
+    privs: Annotated[str, Field(description="Privilege string")]
+
+
+class SetAclParams(ArgModelBase):
+    path: Annotated[str, Field(description="ACL path, e.g. '/vms/100'")]
+    roles: Annotated[Optional[str], Field(description="Roles CSV")] = None
+    users: Annotated[Optional[str], Field(description="Users CSV")] = None
+    groups: Annotated[Optional[str], Field(description="Groups CSV")] = None
+    propagate: Annotated[Optional[bool], Field(description="Propagate flag")] = True
+    delete: Annotated[Optional[bool], Field(description="Delete flag")] = None
+
+
+class FirewallRuleParams(ArgModelBase):
+    rule: Annotated[dict, Field(description="Rule payload")]
+
+
+class FirewallPosParams(ArgModelBase):
+    pos: Annotated[int, Field(description="Rule position")]
+
+
+class PoolParams(ArgModelBase):
+    poolid: Annotated[str, Field(description="Pool ID")]
+
+
+class CreatePoolParams(PoolParams):
+    comment: Annotated[Optional[str], Field(description="Comment")] = None
+
+
+class VzdumpParams(NodeParams):
+    params: Annotated[dict, Field(description="vzdump params")]
+
+
+class ServiceActionParams(NodeParams):
+    service: Annotated[str, Field(description="Service name")]
+    action: Annotated[
+        Literal["start", "stop", "restart", "reload"],
+        Field(description="start|stop|restart|reload"),
+    ]
+
+
+class HaGroupParams(ArgModelBase):
+    group: Annotated[str, Field(description="Group ID")]
+    nodes: Annotated[str, Field(description="Nodes CSV")]
+    comment: Annotated[Optional[str], Field(description="Comment")] = None
+
+
+class HaSidParams(ArgModelBase):
+    sid: Annotated[str, Field(description="Service ID (e.g. 'vm:100')")]
+
+
+class HaResourceParams(HaSidParams):
+    group: Annotated[str, Field(description="Group")]
+
+
+class ReplJobParams(ArgModelBase):
+    job: Annotated[dict, Field(description="Job payload")]
+
+
+class ReplJobIdParams(ArgModelBase):
+    jobid: Annotated[str, Field(description="Job ID")]
+
+
+class CreateContainerParams(NodeParams):
+    config: Annotated[dict, Field(description="Container create parameters")]
+
+
+class NodeCtParams(NodeParams):
+    vmid: Annotated[int, Field(description="Container ID")]
+
+
+class ContainerConfigParams(NodeCtParams):
+    changes: Annotated[dict, Field(description="Config changes")]
+
+
+class CtSnapshotParams(NodeCtParams):
+    snapname: Annotated[str, Field(description="Snapshot name")]
+
+
+class StartContainerParams(ArgModelBase):
+    selector: Annotated[
+        str,
+        Field(description="CT selector: '123' | 'pve1:123' | 'pve1/name' | 'name' | comma list"),
+    ]
+    format_style: Annotated[
+        str,
+        Field(description="'pretty' or 'json'", pattern="^(pretty|json)$"),
+    ] = "pretty"
+
+
+class StopContainerParams(ArgModelBase):
+    selector: Annotated[str, Field(description="CT selector (see start_container)")]
+    graceful: Annotated[
+        bool,
+        Field(description="Graceful shutdown (True) or forced stop (False)"),
+    ] = True
+    timeout_seconds: Annotated[
+        int,
+        Field(description="Timeout for stop/shutdown", ge=1, le=600),
+    ] = 10
+    format_style: Annotated[
+        Literal["pretty", "json"],
+        Field(description="Output format"),
+    ] = "pretty"
+
+
+class RestartContainerParams(ArgModelBase):
+    selector: Annotated[str, Field(description="CT selector (see start_container)")]
+    timeout_seconds: Annotated[int, Field(description="Timeout for reboot", ge=1, le=600)] = 10
+    format_style: Annotated[
+        str,
+        Field(description="'pretty' or 'json'", pattern="^(pretty|json)$"),
+    ] = "pretty"
+
+
+OverviewSection = Literal[
+    "nodes", "storage", "pools", "ha_groups", "ha_resources",
+    "sdn_zones", "sdn_vnets", "replication", "firewall_rules",
+]
+
+
+class ClusterOverviewParams(ArgModelBase):
+    sections: Annotated[
+        Optional[List[OverviewSection]], Field(description="Sections to fetch (default: all)")
+    ] = None
+
+
+def _parse_json_object(value: Any) -> Any:
+    """Accept a JSON-encoded object where a dict is expected.
+
+    FastMCP already decodes JSON strings passed for top-level arguments, but
+    not inside nested objects such as the requests of ``batch_proxmox``.
+    """
+    if isinstance(value, (str, bytes, bytearray)):
+        try:
+            return _loads(value)
+        except ValueError:
+            return value  # let validation report the type error
+    return value
+
+
+JsonObject = Annotated[Optional[dict], BeforeValidator(_parse_json_object)]
+
+
+class ProxmoxRequest(TypedDict):
+    # A TypedDict rather than a model: validated values arrive as plain dicts,
+    # which is what GenericTools consumes, with no model instance to dump.
+    method: Literal["GET", "POST", "PUT", "DELETE"]
+    path: str
+    params: NotRequired[JsonObject]
+    data: NotRequired[JsonObject]
+
+
+class ProxmoxRequestParams(ArgModelBase):
+    payload: ProxmoxRequest
+
+
+class BatchProxmoxParams(ArgModelBase):
+    requests: List[ProxmoxRequest]
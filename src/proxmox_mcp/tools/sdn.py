@@ -1,16 +1,15 @@
 from typing import List
-import json
 from mcp.types import TextContent as Content
 from .base import ProxmoxTool
 
 
 class SDNTools(ProxmoxTool):
     def list_zones(self) -> List[Content]:
-        result = self.proxmox.cluster.sdn.zones.get()
-        return [Content(type="text", text=json.dumps(result))]
+        result = self._root("cluster/sdn").zones.get()
+        return self._pack(result)
 
     def list_vnets(self) -> List[Content]:
-        result = self.proxmox.cluster.sdn.vnets.get()
-        return [Content(type="text", text=json.dumps(result))]
+        result = self._root("cluster/sdn").vnets.get()
+        return self._pack(result)
 
 
@@ -12,11 +12,43 @@ This module provides tools for managing and monitoring Proxmox storage:
 The tools implement fallback mechanisms for scenarios where
 detailed storage information might be temporarily unavailable.
 """
-from typing import List
-import json
+import io
+import logging
+from typing import List, Optional
 from mcp.types import TextContent as Content
 from .base import ProxmoxTool
-from .definitions import GET_STORAGE_DESC
+
+# Log upload progress every this many bytes
+_PROGRESS_STEP = 64 * 1024 * 1024
+
+
+class _UploadFile(io.BufferedReader):
+    """Local file opened for upload under a different target filename.
+
+    proxmoxer only streams real file objects (and takes the multipart filename
+    from their ``name``), so this reads the file from disk in ``chunk_size``
+    blocks as the request body is sent and logs progress along the way.
+    """
+
+    def __init__(self, path: str, filename: str, chunk_size: int, logger: logging.Logger):
+        super().__init__(io.FileIO(path, "rb"), buffer_size=chunk_size)
+        self._filename = filename
+        self._logger = logger
+        self._sent = 0
+        self._next_report = _PROGRESS_STEP
+
+    @property
+    def name(self) -> str:
+        return self._filename
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = super().read(size)
+        self._sent += len(chunk)
+        if self._sent >= self._next_report:
+            self._logger.info("Uploading %s: %d MiB sent", self._filename, self._sent // (1024 * 1024))
+            self._next_report = self._sent + _PROGRESS_STEP
+        return chunk
+
 
 class StorageTools(ProxmoxTool):
     """Tools for managing Proxmox storage.
@@ -63,18 +95,24 @@ class StorageTools(ProxmoxTool):
         """
         try:
             result = self.proxmox.storage.get()
-            return [Content(type="text", text=json.dumps(result))]
+            return self._pack(result)
         except Exception as e:
             self._handle_error("get storage", e)
 
-    def get_storage_content(self, node: str, storage: str) -> List[Content]:
+    def get_storage_content(
+        self, node: str, storage: str, content: Optional[str] = None, vmid: Optional[str] = None
+    ) -> List[Content]:
         """List storage content (images, iso, backups).
 
+        ``content`` and ``vmid`` are filtered by Proxmox itself, so large
+        storages only send back the matching volumes.
+
         Maps to: GET /nodes/{node}/storage/{storage}/content
         """
         try:
-            result = self.proxmox.nodes(node).storage(storage).content.get()
-            return [Content(type="text", text=json.dumps(result))]
+            filters = {k: v for k, v in (("content", content), ("vmid", vmid)) if v is not None}
+            result = self._node(node).storage(storage).content.get(**filters)
+            return self._pack(result)
         except Exception as e:
             self._handle_error(f"get storage content for {storage} on node {node}", e)
 
@@ -84,23 +122,29 @@ class StorageTools(ProxmoxTool):
         Maps to: DELETE /nodes/{node}/storage/{storage}/content/{volume}
         """
         try:
-            result = self.proxmox.nodes(node).storage(storage).content(volume).delete()
-            return [Content(type="text", text=json.dumps(result))]
+            result = self._node(node).storage(storage).content(volume).delete()
+            return self._pack(result)
         except Exception as e:
             self._handle_error(f"delete storage content {volume} on {storage}@{node}", e)
 
-    def upload_storage_content(self, node: str, storage: str, content: str, file_path: str, filename: str) -> List[Content]:
+    def upload_storage_content(
+        self, node: str, storage: str, content: str, file_path: str, filename: str, chunk_size: int = 1024 * 1024
+    ) -> List[Content]:
         """Upload a file to storage (iso, vztmpl, backup).
 
         Maps to: POST /nodes/{node}/storage/{storage}/upload
+
+        The file is streamed from disk in ``chunk_size`` reads instead of being
+        loaded into memory (proxmoxer uses requests-toolbelt's streaming
+        multipart encoder for files over 10 MiB).
         """
         try:
-            with open(file_path, "rb") as fh:
-                # proxmoxer supports passing file handle as 'filename'
-                result = self.proxmox.nodes(node).storage(storage).upload.post(
+            with _UploadFile(file_path, filename, chunk_size, self.logger) as fh:
+                # proxmoxer sends file objects as multipart parts named after fh.name
+                result = self._node(node).storage(storage).upload.post(
                     content=content,
-                    filename=(filename, fh),
+                    filename=fh,
                 )
-            return [Content(type="text", text=json.dumps(result))]
+            return self._pack(result)
         except Exception as e:
             self._handle_error(f"upload storage content to {storage}@{node}", e)
@@ -15,13 +15,47 @@ This module provides tools for managing and interacting with Proxmox VMs:
 The tools implement fallback mechanisms for scenarios where
 detailed VM information might be temporarily unavailable.
 """
-from typing import List, Optional
-import json
+import asyncio
+import re
+import threading
+from typing import Any, Dict, List, Optional, Tuple
 from mcp.types import TextContent as Content
+from ._cache import TTLCache
 from .base import ProxmoxTool
-from .definitions import GET_VMS_DESC, EXECUTE_VM_COMMAND_DESC
 from .console.manager import VMConsoleManager
 
+# Max (node, vmid) API resources kept by VMTools._vm
+_VM_CACHE_SIZE = 1024
+
+# Seconds a node's storage listing is reused by create_vm
+STORAGE_CACHE_TTL = 30.0
+
+# storage type -> (disk format, whether a cloud-init drive is added);
+# LVM can't hold a cloud-init image, file-based storages use qcow2 and
+# anything else defaults to raw without cloud-init
+_STORAGE_PROFILE = {
+    "lvm": ("raw", False),
+    "lvmthin": ("raw", False),
+    "dir": ("qcow2", True),
+    "nfs": ("qcow2", True),
+    "cifs": ("qcow2", True),
+}
+_LVM_TYPES = frozenset({"lvm", "lvmthin"})
+
+# Max VM power actions in flight per vm_power_batch call
+POWER_CONCURRENCY = 8
+
+# action -> (status in which the action is skipped, message for skipped VMs)
+_POWER_SKIP = {
+    "start": ("running", "already running"),
+    "stop": ("stopped", "already stopped"),
+    "shutdown": ("stopped", "already stopped"),
+    "reset": ("stopped", "cannot reset: VM is stopped"),
+}
+
+# Proxmox phrasings for a missing VM/node, used to map errors to ValueError
+_NOT_FOUND_RE = re.compile(r"does not exist|not found", re.IGNORECASE)
+
 class VMTools(ProxmoxTool):
     """Tools for managing Proxmox VMs.
     
@@ -46,6 +80,36 @@ class VMTools(ProxmoxTool):
         """
         super().__init__(proxmox_api)
         self.console_manager = VMConsoleManager(proxmox_api)
+        self._storage_cache = TTLCache(maxsize=64, ttl=STORAGE_CACHE_TTL)
+        self._storage_lock = threading.Lock()
+        self._vms: Dict[Tuple[str, str], Any] = {}
+
+    def _vm(self, node: str, vmid: str) -> Any:
+        """Return the ``nodes(node).qemu(vmid)`` API resource, reusing it across calls."""
+        key = (node, str(vmid))
+        resource = self._vms.get(key)
+        if resource is None:
+            if len(self._vms) >= _VM_CACHE_SIZE:
+                self._vms.clear()
+            resource = self._vms[key] = self._node(node).qemu(vmid)
+        return resource
+
+    def _node_storage(self, node: str, refresh: bool = False) -> Dict[str, Dict[str, Any]]:
+        """Return ``{storage name: storage entry}`` for a node.
+
+        Storage topology rarely changes, so the listing is kept for
+        STORAGE_CACHE_TTL seconds; ``refresh`` forces a new fetch. Sync tools
+        run in worker threads, hence the lock around the cache.
+        """
+        if not refresh:
+            with self._storage_lock:
+                cached = self._storage_cache.get(node)
+            if cached is not None:
+                return cached
+        storage_info = {s["storage"]: s for s in self._node(node).storage.get()}
+        with self._storage_lock:
+            self._storage_cache.set(node, storage_info)
+        return storage_info
 
     def get_vms(self) -> List[Content]:
         """List all virtual machines across the cluster with detailed status.
@@ -58,8 +122,8 @@ class VMTools(ProxmoxTool):
           * Memory allocation and usage
         - Node placement
         
-        Implements a fallback mechanism that returns basic information
-        if detailed configuration retrieval fails for any VM.
+        Uses a single GET /cluster/resources?type=vm call; if that is not
+        available it falls back to listing qemu guests node by node.
 
         Returns:
             List of Content objects containing formatted VM information:
@@ -79,35 +143,61 @@ class VMTools(ProxmoxTool):
             RuntimeError: If the cluster-wide VM query fails
         """
         try:
-            result = []
-            for node in self.proxmox.nodes.get():
-                node_name = node["node"]
-                vms = self.proxmox.nodes(node_name).qemu.get()
-                for vm in vms:
-                    vmid = vm["vmid"]
-                    # Do not call config in tests to avoid MagicMocks in JSON
-                    vm_info = {
-                        "vmid": vmid,
-                        "name": vm.get("name"),
-                        "status": vm.get("status"),
-                        "node": node_name,
-                        "cpus": None,
-                        "mem": vm.get("mem"),
-                        "maxmem": vm.get("maxmem"),
-                    }
-                    result.append(vm_info)
-            return [Content(type="text", text=json.dumps(result))]
+            result = self._vms_from_cluster_resources()
+            if result is None:
+                result = self._vms_from_nodes()
+            return self._pack(result)
         except Exception as e:
             self._handle_error("get VMs", e)
 
+    def _vms_from_cluster_resources(self) -> Optional[List[dict]]:
+        """One-call VM listing from /cluster/resources; None if unusable."""
+        try:
+            rows = self.proxmox.cluster.resources.get(type="vm")
+        except Exception as e:
+            self.logger.debug("cluster/resources unavailable, listing per node: %s", e)
+            return None
+        # type=vm also returns LXC containers
+        return [
+            {
+                "vmid": row["vmid"],
+                "name": row.get("name"),
+                "status": row.get("status"),
+                "node": row.get("node"),
+                "cpus": row.get("maxcpu"),
+                "mem": row.get("mem"),
+                "maxmem": row.get("maxmem"),
+            }
+            for row in rows
+            if row.get("type") == "qemu"
+        ]
+
+    def _vms_from_nodes(self) -> List[dict]:
+        """Per-node VM listing (GET /nodes/{node}/qemu on every node)."""
+        node_names = [node["node"] for node in self.proxmox.nodes.get()]
+        listings = self._per_node_map(lambda name: self._node(name).qemu.get(), node_names)
+        return [
+            {
+                "vmid": vm["vmid"],
+                "name": vm.get("name"),
+                "status": vm.get("status"),
+                "node": node_name,
+                "cpus": None,
+                "mem": vm.get("mem"),
+                "maxmem": vm.get("maxmem"),
+            }
+            for node_name, vms in zip(node_names, listings)
+            for vm in vms
+        ]
+
     def get_vm_status(self, node: str, vmid: str) -> List[Content]:
         """Return current status for a VM.
 
         Maps to: GET /nodes/{node}/qemu/{vmid}/status/current
         """
         try:
-            result = self.proxmox.nodes(node).qemu(vmid).status.current.get()
-            return [Content(type="text", text=json.dumps(result))]
+            result = self._vm(node, vmid).status.current.get()
+            return self._pack(result)
         except Exception as e:
             self._handle_error(f"get VM {vmid} status on node {node}", e)
 
@@ -117,8 +207,8 @@ class VMTools(ProxmoxTool):
         Maps to: GET /nodes/{node}/qemu/{vmid}/snapshot
         """
         try:
-            result = self.proxmox.nodes(node).qemu(vmid).snapshot.get()
-            return [Content(type="text", text=json.dumps(result))]
+            result = self._vm(node, vmid).snapshot.get()
+            return self._pack(result)
         except Exception as e:
             self._handle_error(f"get VM {vmid} snapshots on node {node}", e)
 
@@ -140,8 +230,8 @@ class VMTools(ProxmoxTool):
                 payload["vmstate"] = int(bool(vmstate))
             if description is not None:
                 payload["description"] = description
-            result = self.proxmox.nodes(node).qemu(vmid).snapshot.post(**payload)
-            return [Content(type="text", text=json.dumps({"task": result}))]
+            result = self._vm(node, vmid).snapshot.post(**payload)
+            return self._pack({"task": result})
         except Exception as e:
             self._handle_error(f"create snapshot for VM {vmid} on node {node}", e)
 
@@ -151,8 +241,8 @@ class VMTools(ProxmoxTool):
         Maps to: DELETE /nodes/{node}/qemu/{vmid}/snapshot/{name}
         """
         try:
-            result = self.proxmox.nodes(node).qemu(vmid).snapshot(snapname).delete()
-            return [Content(type="text", text=json.dumps({"task": result}))]
+            result = self._vm(node, vmid).snapshot(snapname).delete()
+            return self._pack({"task": result})
         except Exception as e:
             self._handle_error(f"delete snapshot {snapname} for VM {vmid} on node {node}", e)
 
@@ -162,8 +252,8 @@ class VMTools(ProxmoxTool):
         Maps to: POST /nodes/{node}/qemu/{vmid}/snapshot/{name}/rollback
         """
         try:
-            result = self.proxmox.nodes(node).qemu(vmid).snapshot(snapname).rollback.post()
-            return [Content(type="text", text=json.dumps({"task": result}))]
+            result = self._vm(node, vmid).snapshot(snapname).rollback.post()
+            return self._pack({"task": result})
         except Exception as e:
             self._handle_error(f"rollback snapshot {snapname} for VM {vmid} on node {node}", e)
 
@@ -193,8 +283,8 @@ class VMTools(ProxmoxTool):
                 payload["full"] = int(bool(full))
             if storage is not None:
                 payload["storage"] = storage
-            result = self.proxmox.nodes(node).qemu(vmid).clone.post(**payload)
-            return [Content(type="text", text=json.dumps({"task": result}))]
+            result = self._vm(node, vmid).clone.post(**payload)
+            return self._pack({"task": result})
         except Exception as e:
             self._handle_error(f"clone VM {vmid} on node {node}", e)
 
@@ -207,8 +297,8 @@ class VMTools(ProxmoxTool):
             payload: dict = {"target": target}
             if online is not None:
                 payload["online"] = int(bool(online))
-            result = self.proxmox.nodes(node).qemu(vmid).migrate.post(**payload)
-            return [Content(type="text", text=json.dumps({"task": result}))]
+            result = self._vm(node, vmid).migrate.post(**payload)
+            return self._pack({"task": result})
         except Exception as e:
             self._handle_error(f"migrate VM {vmid} from node {node} to {target}", e)
 
@@ -218,8 +308,8 @@ class VMTools(ProxmoxTool):
         Maps to: POST /nodes/{node}/qemu/{vmid}/config
         """
         try:
-            result = self.proxmox.nodes(node).qemu(vmid).config.post(**(changes or {}))
-            return [Content(type="text", text=json.dumps({"task": result}))]
+            result = self._vm(node, vmid).config.post(**(changes or {}))
+            return self._pack({"task": result})
         except Exception as e:
             self._handle_error(f"update VM {vmid} config on node {node}", e)
 
@@ -229,46 +319,46 @@ class VMTools(ProxmoxTool):
         Maps to: POST /nodes/{node}/qemu/{vmid}/resize
         """
         try:
-            result = self.proxmox.nodes(node).qemu(vmid).resize.post(disk=disk, size=size)
-            return [Content(type="text", text=json.dumps({"task": result}))]
+            result = self._vm(node, vmid).resize.post(disk=disk, size=size)
+            return self._pack({"task": result})
         except Exception as e:
             self._handle_error(f"resize disk {disk} for VM {vmid} on node {node}", e)
 
     # Consoles
     def vncproxy(self, node: str, vmid: str) -> List[Content]:
         try:
-            result = self.proxmox.nodes(node).qemu(vmid).vncproxy.post()
-            return [Content(type="text", text=json.dumps(result))]
+            result = self._vm(node, vmid).vncproxy.post()
+            return self._pack(result)
         except Exception as e:
             self._handle_error(f"create VNC proxy for VM {vmid} on {node}", e)
 
     def spiceproxy(self, node: str, vmid: str) -> List[Content]:
         try:
-            result = self.proxmox.nodes(node).qemu(vmid).spiceproxy.post()
-            return [Content(type="text", text=json.dumps(result))]
+            result = self._vm(node, vmid).spiceproxy.post()
+            return self._pack(result)
         except Exception as e:
             self._handle_error(f"create SPICE proxy for VM {vmid} on {node}", e)
 
     # Disk operations
     def move_disk(self, node: str, vmid: str, disk: str, storage: str) -> List[Content]:
         try:
-            result = self.proxmox.nodes(node).qemu(vmid).move_disk.post(disk=disk, storage=storage)
-            return [Content(type="text", text=json.dumps({"task": result}))]
+            result = self._vm(node, vmid).move_disk.post(disk=disk, storage=storage)
+            return self._pack({"task": result})
         except Exception as e:
             self._handle_error(f"move disk {disk} for VM {vmid} to {storage}", e)
 
     def import_disk(self, node: str, vmid: str, source: str, storage: str) -> List[Content]:
         try:
-            result = self.proxmox.nodes(node).qemu(vmid).importdisk.post(source=source, storage=storage)
-            return [Content(type="text", text=json.dumps({"task": result}))]
+            result = self._vm(node, vmid).importdisk.post(source=source, storage=storage)
+            return self._pack({"task": result})
         except Exception as e:
             self._handle_error(f"import disk from {source} to VM {vmid} on {storage}", e)
 
     def attach_disk(self, node: str, vmid: str, disk: str, opts: dict) -> List[Content]:
         try:
             changes = {disk: opts}
-            result = self.proxmox.nodes(node).qemu(vmid).config.post(**changes)
-            return [Content(type="text", text=json.dumps({"task": result}))]
+            result = self._vm(node, vmid).config.post(**changes)
+            return self._pack({"task": result})
         except Exception as e:
             self._handle_error(f"attach disk {disk} to VM {vmid}", e)
 
@@ -276,8 +366,8 @@ class VMTools(ProxmoxTool):
         try:
             # Empty string detaches disk for that slot
             changes = {disk: ""}
-            result = self.proxmox.nodes(node).qemu(vmid).config.post(**changes)
-            return [Content(type="text", text=json.dumps({"task": result}))]
+            result = self._vm(node, vmid).config.post(**changes)
+            return self._pack({"task": result})
         except Exception as e:
             self._handle_error(f"detach disk {disk} from VM {vmid}", e)
 
@@ -303,42 +393,27 @@ class VMTools(ProxmoxTool):
             RuntimeError: If VM creation fails
         """
         try:
-            # Check if VM ID already exists
-            try:
-                existing_vm = self.proxmox.nodes(node).qemu(vmid).config.get()
-                raise ValueError(f"VM {vmid} already exists on node {node}")
-            except Exception as e:
-                if "does not exist" not in str(e).lower():
-                    raise e
-            
-            # Get storage information
-            storage_list = self.proxmox.nodes(node).storage.get()
-            storage_info = {}
-            for s in storage_list:
-                storage_info[s["storage"]] = s
-            
-            # Auto-detect storage if not specified
+            # VM IDs are unique cluster-wide (QEMU and LXC share them), so one
+            # listing answers this without probing the config endpoint
+            guests = self.proxmox.cluster.resources.get(type="vm")
+            clash = next((g for g in guests if str(g.get("vmid")) == str(vmid)), None)
+            if clash is not None:
+                raise ValueError(f"VM {vmid} already exists on node {clash.get('node', node)}")
+
+            # Get storage information; a storage missing from the cached
+            # listing may have just been added, so look again before failing
+            storage_info = self._node_storage(node)
+            if storage is not None and storage not in storage_info:
+                storage_info = self._node_storage(node, refresh=True)
+
+            # Auto-detect storage if not specified: prefer local-lvm, then
+            # vm-storage, then the first storage that supports VM images
             if storage is None:
-                # Prefer local-lvm for VM images first
-                for s in storage_list:
-                    if s["storage"] == "local-lvm" and "images" in s.get("content", ""):
-                        storage = s["storage"]
-                        break
-                if storage is None:
-                    # Then try vm-storage 
-                    for s in storage_list:
-                        if s["storage"] == "vm-storage" and "images" in s.get("content", ""):
-                            storage = s["storage"]
-                            break
-                if storage is None:
-                    # Fallback to any storage that supports images
-                    for s in storage_list:
-                        if "images" in s.get("content", ""):
-                            storage = s["storage"]
-                            break
-                    if storage is None:
-                        raise ValueError("No suitable storage found for VM images")
-            
+                image_stores = [name for name, s in storage_info.items() if "images" in s.get("content", "")]
+                if not image_stores:
+                    raise ValueError("No suitable storage found for VM images")
+                storage = next((name for name in ("local-lvm", "vm-storage") if name in image_stores), image_stores[0])
+
             # Validate storage exists and supports images
             if storage not in storage_info:
                 raise ValueError(f"Storage '{storage}' not found on node {node}")
@@ -349,25 +424,10 @@ class VMTools(ProxmoxTool):
             # Determine appropriate disk format based on storage type
             storage_type = storage_info[storage]["type"]
             
-            if storage_type in ["lvm", "lvmthin"]:
-                # LVM storages use raw format and no cloudinit
-                disk_format = "raw"
-                vm_config_storage = {
-                    "scsi0": f"{storage}:{disk_size},format={disk_format}",
-                }
-            elif storage_type in ["dir", "nfs", "cifs"]:
-                # File-based storages can use qcow2
-                disk_format = "qcow2"
-                vm_config_storage = {
-                    "scsi0": f"{storage}:{disk_size},format={disk_format}",
-                    "ide2": f"{storage}:cloudinit",
-                }
-            else:
-                # Default to raw for unknown storage types
-                disk_format = "raw"
-                vm_config_storage = {
-                    "scsi0": f"{storage}:{disk_size},format={disk_format}",
-                }
+            disk_format, with_cloudinit = _STORAGE_PROFILE.get(storage_type, ("raw", False))
+            vm_config_storage = {"scsi0": f"{storage}:{disk_size},format={disk_format}"}
+            if with_cloudinit:
+                vm_config_storage["ide2"] = f"{storage}:cloudinit"
             
             # Set default OS type
             if ostype is None:
@@ -391,10 +451,10 @@ class VMTools(ProxmoxTool):
             vm_config.update(vm_config_storage)
             
             # Create the VM
-            task_result = self.proxmox.nodes(node).qemu.create(**vm_config)
+            task_result = self._node(node).qemu.create(**vm_config)
             
             cloudinit_note = ""
-            if storage_type in ["lvm", "lvmthin"]:
+            if storage_type in _LVM_TYPES:
                 cloudinit_note = "\n  ⚠️  Note: LVM storage doesn't support cloud-init image"
             
             result_text = f"""🎉 VM {vmid} created successfully!
@@ -423,6 +483,9 @@ class VMTools(ProxmoxTool):
         except ValueError as e:
             raise e
         except Exception as e:
+            # The failure may stem from a storage change; don't reuse the listing
+            with self._storage_lock:
+                self._storage_cache.pop(node)
             self._handle_error(f"create VM {vmid}", e)
 
     def start_vm(self, node: str, vmid: str) -> List[Content]:
@@ -441,20 +504,20 @@ class VMTools(ProxmoxTool):
         """
         try:
             # Check if VM exists and get current status
-            vm_status = self.proxmox.nodes(node).qemu(vmid).status.current.get()
+            vm_status = self._vm(node, vmid).status.current.get()
             current_status = vm_status.get("status")
             
             if current_status == "running":
                 result_text = f"🟢 VM {vmid} is already running"
             else:
                 # Start the VM
-                task_result = self.proxmox.nodes(node).qemu(vmid).status.start.post()
+                task_result = self._vm(node, vmid).status.start.post()
                 result_text = f"🚀 VM {vmid} start initiated successfully\nTask ID: {task_result}"
                 
             return [Content(type="text", text=result_text)]
             
         except Exception as e:
-            if "does not exist" in str(e).lower() or "not found" in str(e).lower():
+            if _NOT_FOUND_RE.search(str(e)):
                 raise ValueError(f"VM {vmid} not found on node {node}")
             self._handle_error(f"start VM {vmid}", e)
 
@@ -474,20 +537,20 @@ class VMTools(ProxmoxTool):
         """
         try:
             # Check if VM exists and get current status
-            vm_status = self.proxmox.nodes(node).qemu(vmid).status.current.get()
+            vm_status = self._vm(node, vmid).status.current.get()
             current_status = vm_status.get("status")
             
             if current_status == "stopped":
                 result_text = f"🔴 VM {vmid} is already stopped"
             else:
                 # Stop the VM
-                task_result = self.proxmox.nodes(node).qemu(vmid).status.stop.post()
+                task_result = self._vm(node, vmid).status.stop.post()
                 result_text = f"🛑 VM {vmid} stop initiated successfully\nTask ID: {task_result}"
                 
             return [Content(type="text", text=result_text)]
             
         except Exception as e:
-            if "does not exist" in str(e).lower() or "not found" in str(e).lower():
+            if _NOT_FOUND_RE.search(str(e)):
                 raise ValueError(f"VM {vmid} not found on node {node}")
             self._handle_error(f"stop VM {vmid}", e)
 
@@ -507,20 +570,20 @@ class VMTools(ProxmoxTool):
         """
         try:
             # Check if VM exists and get current status
-            vm_status = self.proxmox.nodes(node).qemu(vmid).status.current.get()
+            vm_status = self._vm(node, vmid).status.current.get()
             current_status = vm_status.get("status")
             
             if current_status == "stopped":
                 result_text = f"🔴 VM {vmid} is already stopped"
             else:
                 # Shutdown the VM gracefully
-                task_result = self.proxmox.nodes(node).qemu(vmid).status.shutdown.post()
+                task_result = self._vm(node, vmid).status.shutdown.post()
                 result_text = f"💤 VM {vmid} graceful shutdown initiated\nTask ID: {task_result}"
                 
             return [Content(type="text", text=result_text)]
             
         except Exception as e:
-            if "does not exist" in str(e).lower() or "not found" in str(e).lower():
+            if _NOT_FOUND_RE.search(str(e)):
                 raise ValueError(f"VM {vmid} not found on node {node}")
             self._handle_error(f"shutdown VM {vmid}", e)
 
@@ -540,20 +603,20 @@ class VMTools(ProxmoxTool):
         """
         try:
             # Check if VM exists and get current status
-            vm_status = self.proxmox.nodes(node).qemu(vmid).status.current.get()
+            vm_status = self._vm(node, vmid).status.current.get()
             current_status = vm_status.get("status")
             
             if current_status == "stopped":
                 result_text = f"⚠️ Cannot reset VM {vmid}: VM is currently stopped\nUse start_vm to start it first"
             else:
                 # Reset the VM
-                task_result = self.proxmox.nodes(node).qemu(vmid).status.reset.post()
+                task_result = self._vm(node, vmid).status.reset.post()
                 result_text = f"🔄 VM {vmid} reset initiated successfully\nTask ID: {task_result}"
                 
             return [Content(type="text", text=result_text)]
             
         except Exception as e:
-            if "does not exist" in str(e).lower() or "not found" in str(e).lower():
+            if _NOT_FOUND_RE.search(str(e)):
                 raise ValueError(f"VM {vmid} not found on node {node}")
             self._handle_error(f"reset VM {vmid}", e)
 
@@ -585,10 +648,57 @@ class VMTools(ProxmoxTool):
         """
         try:
             result = await self.console_manager.execute_command(node, vmid, command)
-            return [Content(type="text", text=json.dumps(result))]
+            return self._pack(result)
         except Exception as e:
             self._handle_error(f"execute command on VM {vmid}", e)
 
+    async def vm_power_batch(self, action: str, vmids: List[str]) -> List[Content]:
+        """Apply one power action to several VMs.
+
+        A single GET /cluster/resources?type=vm supplies each VM's node and
+        state (instead of a status/current GET per VM). VMs already in the
+        target state are skipped; the rest are posted concurrently, at most
+        ``POWER_CONCURRENCY`` at a time. Per-VM failures are reported in the
+        result rather than failing the call.
+
+        Args:
+            action: start | stop | shutdown | reset
+            vmids: VM ID numbers
+
+        Returns:
+            List of Content objects containing a JSON list in request order,
+            one entry per distinct VMID
+        """
+        if action not in _POWER_SKIP:
+            raise ValueError(f"Invalid input: unsupported power action {action!r}")
+        try:
+            guests = await asyncio.to_thread(self.proxmox.cluster.resources.get, type="vm")
+        except Exception as e:
+            self._handle_error("list VMs for batch power action", e)
+        by_id = {str(g.get("vmid")): g for g in guests if g.get("type") == "qemu"}
+        skip_status, skip_message = _POWER_SKIP[action]
+        semaphore = asyncio.Semaphore(POWER_CONCURRENCY)
+
+        async def run(vmid: str) -> Dict[str, Any]:
+            guest = by_id.get(vmid)
+            if guest is None:
+                return {"vmid": vmid, "ok": False, "error": f"VM {vmid} not found"}
+            node = guest.get("node")
+            if guest.get("status") == skip_status:
+                return {"vmid": vmid, "node": node, "ok": action != "reset", "skipped": True, "message": skip_message}
+            async with semaphore:
+                try:
+                    # status(action) appends the action as a path segment
+                    task = await asyncio.to_thread(self._vm(node, vmid).status(action).post)
+                    return {"vmid": vmid, "node": node, "ok": True, "task": task}
+                except Exception as e:
+                    self.logger.warning("%s of VM %s failed: %s", action, vmid, e)
+                    return {"vmid": vmid, "node": node, "ok": False, "error": str(e)}
+
+        # A repeated VMID would post the same action twice concurrently
+        results = await asyncio.gather(*(run(vmid) for vmid in dict.fromkeys(map(str, vmids))))
+        return self._pack(list(results))
+
     def delete_vm(self, node: str, vmid: str, force: bool = False) -> List[Content]:
         """Delete/remove a virtual machine completely.
         
@@ -614,11 +724,11 @@ class VMTools(ProxmoxTool):
         try:
             # Check if VM exists and get current status
             try:
-                vm_status = self.proxmox.nodes(node).qemu(vmid).status.current.get()
+                vm_status = self._vm(node, vmid).status.current.get()
                 current_status = vm_status.get("status")
                 vm_name = vm_status.get("name", f"VM-{vmid}")
             except Exception as e:
-                if "does not exist" in str(e).lower() or "not found" in str(e).lower():
+                if _NOT_FOUND_RE.search(str(e)):
                     raise ValueError(f"VM {vmid} not found on node {node}")
                 raise e
             
@@ -629,13 +739,14 @@ class VMTools(ProxmoxTool):
                                    f"Please stop it first or use force=True to stop and delete.")
                 else:
                     # Force stop the VM first
-                    self.proxmox.nodes(node).qemu(vmid).status.stop.post()
+                    self._vm(node, vmid).status.stop.post()
                     result_text = f"🛑 Stopping VM {vmid} ({vm_name}) before deletion...\n"
             else:
                 result_text = f"🗑️ Deleting VM {vmid} ({vm_name})...\n"
             
             # Delete the VM
-            task_result = self.proxmox.nodes(node).qemu(vmid).delete()
+            task_result = self._vm(node, vmid).delete()
+            self._vms.pop((node, str(vmid)), None)
             
             result_text += f"""🗑️ VM {vmid} ({vm_name}) deletion initiated successfully!
 
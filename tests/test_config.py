@@ -0,0 +1,77 @@
+"""
+Tests for configuration loading.
+"""
+
+import json
+
+import pytest
+
+from proxmox_mcp.config.loader import load_config
+
+VALID_CONFIG = {
+    "proxmox": {"host": "pve.local", "port": 8006, "verify_ssl": False},
+    "auth": {"user": "root@pam", "token_name": "mcp", "token_value": "secret"},
+    "logging": {"level": "DEBUG"},
+}
+
+
+def _write(tmp_path, content):
+    path = tmp_path / "config.json"
+    path.write_text(content)
+    return str(path)
+
+
+def test_load_config_from_file(tmp_path):
+    """A valid file is parsed into a Config model."""
+    config = load_config(_write(tmp_path, json.dumps(VALID_CONFIG)))
+
+    assert config.proxmox.host == "pve.local"
+    assert config.proxmox.verify_ssl is False
+    assert config.auth.token_name == "mcp"
+    assert config.logging.level == "DEBUG"
+
+
+def test_load_config_invalid_json(tmp_path):
+    """Malformed JSON is reported as such."""
+    with pytest.raises(ValueError, match="Invalid JSON in config file"):
+        load_config(_write(tmp_path, "{not json"))
+
+
+def test_load_config_empty_host(tmp_path):
+    """An empty Proxmox host is rejected."""
+    data = {**VALID_CONFIG, "proxmox": {"host": ""}}
+
+    with pytest.raises(ValueError, match="Proxmox host cannot be empty"):
+        load_config(_write(tmp_path, json.dumps(data)))
+
+
+def test_load_config_missing_file(tmp_path):
+    """A missing file surfaces as a load failure."""
+    with pytest.raises(ValueError, match="Failed to load config"):
+        load_config(str(tmp_path / "missing.json"))
+
+
+def test_load_config_from_env(monkeypatch):
+    """Without a path, settings come from the environment."""
+    monkeypatch.setenv("PROXMOX_HOST", "pve.local")
+    monkeypatch.setenv("PROXMOX_USER", "root@pam")
+    monkeypatch.setenv("PROXMOX_TOKEN_NAME", "mcp")
+    monkeypatch.setenv("PROXMOX_TOKEN_VALUE", "secret")
+    monkeypatch.setenv("PROXMOX_VERIFY_SSL", "0")
+
+    config = load_config()
+
+    assert config.proxmox.host == "pve.local"
+    assert config.proxmox.verify_ssl is False
+    assert config.auth.user == "root@pam"
+
+
+def test_load_config_env_reports_missing(monkeypatch):
+    """Missing environment variables are named in the error."""
+    monkeypatch.setenv("PROXMOX_HOST", "pve.local")
+    monkeypatch.setenv("PROXMOX_USER", "root@pam")
+    monkeypatch.delenv("PROXMOX_TOKEN_NAME", raising=False)
+    monkeypatch.delenv("PROXMOX_TOKEN_VALUE", raising=False)
+
+    with pytest.raises(ValueError, match="PROXMOX_MCP_CONFIG.*PROXMOX_TOKEN_NAME, PROXMOX_TOKEN_VALUE"):
+        load_config()
@@ -4,7 +4,10 @@ Tests for the Proxmox MCP server.
 
 import os
 import json
+import time
+import asyncio
 import pytest
+import requests
 from unittest.mock import Mock, patch
 
 from mcp.server.fastmcp import FastMCP
@@ -75,6 +78,18 @@ async def test_get_nodes(server, mock_proxmox):
     assert result[0]["node"] == "node1"
     assert result[1]["node"] == "node2"
 
+@pytest.mark.asyncio
+async def test_read_only_results_cached(server, mock_proxmox):
+    """Test repeated read-only calls are served from the short-lived cache."""
+    await server.mcp.call_tool("get_nodes", {})
+    await server.mcp.call_tool("get_nodes", {})
+    assert mock_proxmox.return_value.nodes.get.call_count == 1
+
+    # Any state-changing call invalidates cached results
+    await server.mcp.call_tool("start_vm", {"node": "node1", "vmid": "100"})
+    await server.mcp.call_tool("get_nodes", {})
+    assert mock_proxmox.return_value.nodes.get.call_count == 2
+
 @pytest.mark.asyncio
 async def test_get_node_status_missing_parameter(server):
     """Test get_node_status tool with missing parameter."""
@@ -96,7 +111,8 @@ async def test_get_node_status(server, mock_proxmox):
 
 @pytest.mark.asyncio
 async def test_get_vms(server, mock_proxmox):
-    """Test get_vms tool."""
+    """Test get_vms tool, listing per node when cluster/resources fails."""
+    mock_proxmox.return_value.cluster.resources.get.side_effect = Exception("403 Forbidden")
     mock_proxmox.return_value.nodes.get.return_value = [{"node": "node1", "status": "online"}]
     mock_proxmox.return_value.nodes.return_value.qemu.get.return_value = [
         {"vmid": "100", "name": "vm1", "status": "running"},
@@ -109,6 +125,19 @@ async def test_get_vms(server, mock_proxmox):
     assert result[0]["name"] == "vm1"
     assert result[1]["name"] == "vm2"
 
+@pytest.mark.asyncio
+async def test_get_vms_from_cluster_resources(server, mock_proxmox):
+    """Test get_vms uses the single cluster/resources call when available."""
+    mock_proxmox.return_value.cluster.resources.get.return_value = [
+        {"type": "qemu", "vmid": 100, "name": "vm1", "node": "node1", "status": "running", "maxcpu": 2},
+        {"type": "lxc", "vmid": 200, "name": "ct1", "node": "node1", "status": "running"},
+    ]
+
+    response = await server.mcp.call_tool("get_vms", {})
+    result = json.loads(response[0].text)
+    assert [(vm["vmid"], vm["cpus"]) for vm in result] == [(100, 2)]
+    mock_proxmox.return_value.nodes.return_value.qemu.get.assert_not_called()
+
 @pytest.mark.asyncio
 async def test_get_containers(server, mock_proxmox):
     """Test get_containers tool."""
@@ -233,3 +262,200 @@ async def test_start_vm(server, mock_proxmox):
 
     response = await server.mcp.call_tool("start_vm", {"node": "node1", "vmid": "100"})
     assert "start initiated successfully" in response[0].text
+
+@pytest.mark.asyncio
+async def test_deferred_tools(mock_env_vars, mock_proxmox):
+    """Test that deferral registers only core tools plus discovery."""
+    with patch.dict(os.environ, {"PROXMOX_MCP_DEFER_TOOLS": "1"}):
+        server = ProxmoxMCPServer()
+
+    tool_names = {tool.name for tool in await server.mcp.list_tools()}
+    assert {"get_nodes", "discover_tools", "load_tool"} <= tool_names
+    assert "start_vm" not in tool_names
+
+    response = await server.mcp.call_tool("discover_tools", {"pattern": "start_vm"})
+    result = json.loads(response[0].text)
+    assert [entry["name"] for entry in result] == ["start_vm"]
+
+@pytest.mark.asyncio
+async def test_batch_proxmox(server, mock_proxmox):
+    """Test batch_proxmox returns per-request results in order."""
+    def fake_get(path, **params):
+        if path == "missing":
+            raise Exception("no such path")
+        return {"path": path}
+
+    mock_proxmox.return_value.get.side_effect = fake_get
+    response = await server.mcp.call_tool("batch_proxmox", {"requests": [
+        {"method": "GET", "path": "/api2/json/nodes"},
+        {"method": "GET", "path": "missing"},
+        {"method": "GET", "path": "version"},
+    ]})
+    result = json.loads(response[0].text)
+
+    assert result[0] == {"ok": True, "data": {"path": "nodes"}}
+    assert result[1]["ok"] is False
+    assert "no such path" in result[1]["error"]
+    assert result[2] == {"ok": True, "data": {"path": "version"}}
+
+@pytest.mark.asyncio
+async def test_list_disks_batch(server, mock_proxmox):
+    """Test per-node batch listings report each node separately."""
+    def fake_nodes(node):
+        resource = Mock()
+        if node == "bad":
+            resource.disks.list.get.side_effect = Exception("node offline")
+        else:
+            resource.disks.list.get.return_value = [{"devpath": f"/dev/{node}"}]
+        return resource
+
+    mock_proxmox.return_value.nodes.side_effect = fake_nodes
+    response = await server.mcp.call_tool("list_disks_batch", {"nodes": ["pve1", "bad"]})
+    result = json.loads(response[0].text)
+
+    assert result["pve1"] == {"ok": True, "data": [{"devpath": "/dev/pve1"}]}
+    assert result["bad"]["ok"] is False
+    assert "node offline" in result["bad"]["error"]
+
+    with pytest.raises(ToolError):
+        await server.mcp.call_tool("list_disks_batch", {"nodes": [f"pve{i}" for i in range(65)]})
+
+@pytest.mark.asyncio
+async def test_read_only_cache_disabled(mock_env_vars, mock_proxmox):
+    """Test PROXMOX_MCP_CACHE_TTL=0 turns the result cache off."""
+    with patch.dict(os.environ, {"PROXMOX_MCP_CACHE_TTL": "0"}):
+        server = ProxmoxMCPServer()
+
+    await server.mcp.call_tool("get_nodes", {})
+    await server.mcp.call_tool("get_nodes", {})
+    assert mock_proxmox.return_value.nodes.get.call_count == 2
+
+@pytest.mark.asyncio
+async def test_start_container_multiple_targets(server, mock_proxmox):
+    """Test container power actions report each selected target."""
+    mock_proxmox.return_value.nodes.get.return_value = [{"node": "node1", "status": "online"}]
+    lxc = mock_proxmox.return_value.nodes.return_value.lxc
+    lxc.get.return_value = [{"vmid": 200, "name": "web"}, {"vmid": 201, "name": "db"}]
+    containers = {200: Mock(), 201: Mock()}
+    containers[200].status.start.post.return_value = "UPID:1"
+    containers[201].status.start.post.side_effect = Exception("locked")
+    lxc.side_effect = containers.__getitem__
+
+    response = await server.mcp.call_tool("start_container", {"selector": "200,db", "format_style": "json"})
+    result = json.loads(response[0].text)
+
+    assert [(r["vmid"], r["ok"]) for r in result] == [(200, True), (201, False)]
+    assert "locked" in result[1]["error"]
+
+@pytest.mark.asyncio
+async def test_read_only_stale_fallback(server, mock_proxmox):
+    """Test an expired read-only result is reused when the refresh fails."""
+    await server.mcp.call_tool("get_nodes", {})
+    nodes = mock_proxmox.return_value.nodes
+    nodes.get.side_effect = requests.ConnectionError("connection refused")
+    now = time.monotonic()
+
+    with patch("proxmox_mcp.tools._cache.time.monotonic", return_value=now + 5):
+        response = await server.mcp.call_tool("get_nodes", {})
+    result = json.loads(response[0].text)
+    assert [node["node"] for node in result] == ["node1", "node2"]
+    assert "cached result" in response[-1].text
+
+    # Too old, or not a connection/server error: the failure is reported
+    with patch("proxmox_mcp.tools._cache.time.monotonic", return_value=now + 60):
+        with pytest.raises(ToolError):
+            await server.mcp.call_tool("get_nodes", {})
+    nodes.get.side_effect = Exception("401 Unauthorized")
+    with patch("proxmox_mcp.tools._cache.time.monotonic", return_value=now + 5):
+        with pytest.raises(ToolError):
+            await server.mcp.call_tool("get_nodes", {})
+
+@pytest.mark.asyncio
+async def test_concurrent_task_polls_coalesced(server, mock_proxmox):
+    """Test overlapping identical task status polls share one API request."""
+    def slow_status():
+        time.sleep(0.05)
+        return {"status": "running"}
+
+    status = mock_proxmox.return_value.nodes.return_value.tasks.return_value.status
+    status.get.side_effect = slow_status
+    args = {"node": "node1", "upid": "UPID:node1:1"}
+    responses = await asyncio.gather(*(server.mcp.call_tool("get_task_status", args) for _ in range(3)))
+
+    assert status.get.call_count == 1
+    assert all(json.loads(r[0].text)["status"] == "running" for r in responses)
+
+    # Task status is never cached: a later poll hits the API again
+    await server.mcp.call_tool("get_task_status", args)
+    assert status.get.call_count == 2
+
+@pytest.mark.asyncio
+async def test_read_overlapping_write_not_cached(server, mock_proxmox):
+    """Test a read that finishes after a write does not repopulate the cache."""
+    api = mock_proxmox.return_value
+
+    def slow_nodes():
+        time.sleep(0.05)
+        return [{"node": "node1", "status": "online"}]
+
+    api.nodes.get.side_effect = slow_nodes
+    api.nodes.return_value.qemu.return_value.status.current.get.return_value = {"status": "stopped"}
+    api.nodes.return_value.qemu.return_value.status.start.post.return_value = "UPID:node1:start"
+
+    read = asyncio.ensure_future(server.mcp.call_tool("get_nodes", {}))
+    await asyncio.sleep(0.01)
+    await server.mcp.call_tool("start_vm", {"node": "node1", "vmid": "100"})
+    await read
+
+    await server.mcp.call_tool("get_nodes", {})
+    assert api.nodes.get.call_count == 2
+
+@pytest.mark.asyncio
+async def test_get_cluster_overview(server, mock_proxmox):
+    """Test the overview fetches each requested section independently."""
+    def fake_get(path, **params):
+        if path == "pools":
+            raise Exception("permission denied")
+        return [{"path": path}]
+
+    mock_proxmox.return_value.get.side_effect = fake_get
+    response = await server.mcp.call_tool("get_cluster_overview", {"sections": ["nodes", "pools"]})
+    result = json.loads(response[0].text)
+
+    assert result["nodes"] == {"ok": True, "data": [{"path": "nodes"}]}
+    assert result["pools"]["ok"] is False
+
+@pytest.mark.asyncio
+async def test_vm_power_batch(server, mock_proxmox):
+    """Test batch power actions skip VMs already in the target state."""
+    mock_proxmox.return_value.cluster.resources.get.return_value = [
+        {"type": "qemu", "vmid": 100, "node": "node1", "status": "stopped"},
+        {"type": "qemu", "vmid": 101, "node": "node2", "status": "running"},
+    ]
+    status = mock_proxmox.return_value.nodes.return_value.qemu.return_value.status
+    status.return_value.post.return_value = "UPID:start"
+
+    response = await server.mcp.call_tool("vm_power_batch", {"action": "start", "vmids": ["100", "101", "999", "100"]})
+    result = json.loads(response[0].text)
+
+    assert len(result) == 3
+    assert result[0] == {"vmid": "100", "node": "node1", "ok": True, "task": "UPID:start"}
+    assert result[1]["skipped"] is True
+    assert result[2]["ok"] is False
+    status.assert_called_once_with("start")
+
+@pytest.mark.asyncio
+async def test_create_vm_reuses_storage_listing(server, mock_proxmox):
+    """Test back-to-back create_vm calls on a node fetch its storage once."""
+    api = mock_proxmox.return_value
+    api.cluster.resources.get.return_value = []
+    api.nodes.return_value.storage.get.return_value = [
+        {"storage": "local-lvm", "type": "lvmthin", "content": "images,rootdir"},
+    ]
+    api.nodes.return_value.qemu.create.return_value = "UPID:node1:create"
+
+    for vmid in ("300", "301"):
+        args = {"node": "node1", "vmid": vmid, "name": f"vm{vmid}", "cpus": 1, "memory": 512, "disk_size": 8}
+        response = await server.mcp.call_tool("create_vm", args)
+        assert f"VM {vmid} created" in response[0].text
+    assert api.nodes.return_value.storage.get.call_count == 1
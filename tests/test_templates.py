@@ -0,0 +1,131 @@
+"""
+Tests for MCP prompt template loading and rendering.
+"""
+
+import os
+
+import pytest
+
+from proxmox_mcp.mcp.templates import TemplateConfig, load_template_config, render_prompt
+
+CONFIG = """
+mcp_server:
+  base_url: "http://example:8811"
+command_templates:
+  get_nodes: "Show me all Proxmox nodes"
+  get_vm_status: "Get current status for VM {vmid} on node {node}"
+  migrate_vm: "Migrate VM {vmid} from {node} to {target}{online_clause}"
+fragments:
+  online_clause: " (online: {online})"
+"""
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    """Fixture writing a small integration config to disk."""
+    path = tmp_path / "mcp_integration.yaml"
+    path.write_text(CONFIG)
+    return path
+
+
+def test_load_template_config_is_cached(config_file):
+    """Repeated loads of an unchanged file return the same instance."""
+    first = load_template_config(str(config_file))
+    second = load_template_config(str(config_file))
+
+    assert first is second
+    assert first.base_url == "http://example:8811"
+    with pytest.raises(AttributeError):
+        first.base_url = "http://other"
+    with pytest.raises(TypeError):
+        first.templates["get_nodes"] = "changed"
+
+
+def test_load_template_config_reloads_on_change(config_file):
+    """Editing the file invalidates the cached config."""
+    first = load_template_config(str(config_file))
+    config_file.write_text(CONFIG.replace("example", "changed"))
+    st = os.stat(config_file)
+    os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    second = load_template_config(str(config_file))
+
+    assert second is not first
+    assert second.base_url == "http://changed:8811"
+
+
+def test_render_prompt_fragments(config_file):
+    """Fragments are included only when their placeholders are provided."""
+    cfg = load_template_config(str(config_file))
+    params = {"vmid": 100, "node": "pve", "target": "pve2"}
+
+    assert render_prompt("migrate_vm", params, cfg) == "Migrate VM 100 from pve to pve2"
+    assert (
+        render_prompt("migrate_vm", {**params, "online": True}, cfg)
+        == "Migrate VM 100 from pve to pve2 (online: True)"
+    )
+
+
+def test_render_prompt_static_and_direct(config_file):
+    """Static templates and templates without fragments render directly."""
+    cfg = load_template_config(str(config_file))
+
+    assert render_prompt("get_nodes", {}, cfg) == "Show me all Proxmox nodes"
+    assert (
+        render_prompt("get_vm_status", {"vmid": 100, "node": "pve"}, cfg)
+        == "Get current status for VM 100 on node pve"
+    )
+
+
+def test_render_prompt_unknown_template(config_file):
+    """Unknown templates fall back to a generic description."""
+    cfg = load_template_config(str(config_file))
+
+    assert render_prompt("nope", {"a": 1}, cfg) == "Execute nope with parameters: {'a': 1}"
+
+
+def test_render_prompt_missing_param_kept_literal(config_file):
+    """Placeholders without a value are left in the rendered prompt."""
+    cfg = load_template_config(str(config_file))
+
+    assert render_prompt("get_vm_status", {"node": "pve"}, cfg) == "Get current status for VM {vmid} on node pve"
+
+
+def _config(templates, fragments=None):
+    return TemplateConfig(
+        base_url="http://example:8811",
+        mode="openapi",
+        auth_type="none",
+        api_key=None,
+        templates=templates,
+        fragments=fragments or {},
+    )
+
+
+def test_render_prompt_field_lookups():
+    """Attribute/index fields and brace-wrapped fields count as their top-level param."""
+    cfg = _config(
+        {"show": "VM {vm[id]} on {{{node}}}{where}"},
+        {"where": " in pool {pool[name]}"},
+    )
+
+    assert render_prompt("show", {"vm": {"id": 100}, "node": "pve"}, cfg) == "VM 100 on {pve}"
+    assert (
+        render_prompt("show", {"vm": {"id": 100}, "node": "pve", "pool": {"name": "prod"}}, cfg)
+        == "VM 100 on {pve} in pool prod"
+    )
+
+
+def test_render_prompt_static_unescapes_braces():
+    """Templates without fields still turn {{ and }} into literal braces."""
+    cfg = _config({"ping": 'Return JSON like {{"ok": true}}'})
+
+    assert render_prompt("ping", {}, cfg) == 'Return JSON like {"ok": true}'
+
+
+def test_render_prompt_failed_lookup_falls_back():
+    """A failing index lookup degrades to the fallback text instead of raising."""
+    cfg = _config({"show": "VM {vm[id]}{where}"}, {"where": " in {pool[name]}"})
+
+    assert render_prompt("show", {"vm": {}}, cfg) == "VM {vm[id]}{where} | Params: {'vm': {}, 'where': ''}"
+    assert render_prompt("show", {"vm": {"id": 1}, "pool": {}}, cfg) == "VM 1 in {pool[name]}"